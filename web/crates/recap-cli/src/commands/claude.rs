@@ -92,10 +92,13 @@ async fn list_sessions(ctx: &Context, project_filter: Option<String>, date_filte
         return Ok(());
     }
 
-    // Parse date filter if provided
-    let filter_date: Option<NaiveDate> = if let Some(date_str) = &date_filter {
+    // Parse date filter if provided; kept as a canonical YYYY-MM-DD string so
+    // each session's date (already sliced from its ISO timestamp) is compared
+    // directly instead of being parsed again
+    let filter_date: Option<String> = if let Some(date_str) = &date_filter {
         Some(NaiveDate::parse_from_str(date_str, "%Y-%m-%d")
-            .map_err(|_| anyhow::anyhow!("Invalid date format. Use YYYY-MM-DD"))?)
+            .map_err(|_| anyhow::anyhow!("Invalid date format. Use YYYY-MM-DD"))?
+            .to_string())
     } else {
         None
     };
@@ -135,12 +138,8 @@ async fn list_sessions(ctx: &Context, project_filter: Option<String>, date_filte
                         }
 
                         // Apply date filter
-                        if let Some(filter_date) = filter_date {
-                            if let Ok(session_date) = NaiveDate::parse_from_str(&session.date, "%Y-%m-%d") {
-                                if session_date != filter_date {
-                                    continue;
-                                }
-                            } else {
+                        if let Some(ref filter_date) = filter_date {
+                            if session.date != *filter_date {
                                 continue;
                             }
                         }
@@ -556,23 +556,10 @@ mod tests {
     // ========================================================================
 
     #[test]
-    fn test_validate_llm_provider_openai() {
-        assert!(validate_llm_provider("openai").is_ok());
-    }
-
-    #[test]
-    fn test_validate_llm_provider_anthropic() {
-        assert!(validate_llm_provider("anthropic").is_ok());
-    }
-
-    #[test]
-    fn test_validate_llm_provider_ollama() {
-        assert!(validate_llm_provider("ollama").is_ok());
-    }
-
-    #[test]
-    fn test_validate_llm_provider_openai_compatible() {
-        assert!(validate_llm_provider("openai-compatible").is_ok());
+    fn test_validate_llm_provider_valid() {
+        for provider in ["openai", "anthropic", "ollama", "openai-compatible"] {
+            assert!(validate_llm_provider(provider).is_ok(), "{} should be valid", provider);
+        }
     }
 
     #[test]
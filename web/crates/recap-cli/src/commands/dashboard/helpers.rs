@@ -49,6 +49,21 @@ pub fn truncate(s: &str, max_chars: usize) -> String {
     }
 }
 
+/// The `n` entries with the most hours, most first.
+///
+/// Partially selects the top `n` before sorting, so only the ranked slice is
+/// ever fully ordered.
+pub fn top_by_hours<T>(mut entries: Vec<T>, n: usize, hours: impl Fn(&T) -> f64) -> Vec<T> {
+    let by_hours_desc =
+        |a: &T, b: &T| hours(b).partial_cmp(&hours(a)).unwrap_or(std::cmp::Ordering::Equal);
+    if entries.len() > n {
+        entries.select_nth_unstable_by(n, by_hours_desc);
+        entries.truncate(n);
+    }
+    entries.sort_by(by_hours_desc);
+    entries
+}
+
 /// Get the default user ID from database
 pub async fn get_default_user_id(db: &recap_core::Database) -> Result<String> {
     let user: Option<(String,)> = sqlx::query_as(
@@ -104,6 +119,16 @@ mod tests {
         assert!(parse_date("2025/01/15").is_err());
     }
 
+    #[test]
+    fn test_top_by_hours() {
+        let entries = vec![("a", 1.0), ("b", 10.0), ("c", 2.5), ("d", 9.0)];
+        let top = top_by_hours(entries.clone(), 2, |e| e.1);
+        assert_eq!(top, vec![("b", 10.0), ("d", 9.0)]);
+
+        let all = top_by_hours(entries, 10, |e| e.1);
+        assert_eq!(all.iter().map(|e| e.0).collect::<Vec<_>>(), vec!["b", "d", "c", "a"]);
+    }
+
     #[test]
     fn test_extract_project_name_with_brackets() {
         assert_eq!(extract_project_name("[project] task"), "project");
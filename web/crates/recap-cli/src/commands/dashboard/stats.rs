@@ -8,7 +8,7 @@ use std::collections::HashMap;
 
 use crate::commands::Context;
 use crate::output::print_output;
-use super::helpers::{extract_project_name, get_default_user_id, parse_date, truncate};
+use super::helpers::{extract_project_name, get_default_user_id, parse_date, top_by_hours, truncate};
 use super::types::{ProjectRow, SourceRow, StatsRow};
 
 pub async fn show_stats(
@@ -118,18 +118,18 @@ pub async fn show_stats(
     if !hours_by_source.is_empty() {
         println!("📁 按來源分類");
         println!("───────────────────────────────────────────────────────────────");
-        let mut source_rows: Vec<SourceRow> = hours_by_source
-            .iter()
+        let sources = top_by_hours(hours_by_source.into_iter().collect(), usize::MAX, |(_, hours)| *hours);
+        let source_rows: Vec<SourceRow> = sources
+            .into_iter()
             .map(|(source, hours)| {
                 let pct = if total_hours > 0.0 { (hours / total_hours) * 100.0 } else { 0.0 };
                 SourceRow {
-                    source: source.clone(),
+                    source,
                     hours: format!("{:.1}h", hours),
                     percentage: format!("{:.1}%", pct),
                 }
             })
             .collect();
-        source_rows.sort_by(|a, b| b.hours.partial_cmp(&a.hours).unwrap_or(std::cmp::Ordering::Equal));
         print_output(&source_rows, ctx.format)?;
         println!();
     }
@@ -138,24 +138,21 @@ pub async fn show_stats(
     if !hours_by_project.is_empty() {
         println!("🏆 專案排行");
         println!("───────────────────────────────────────────────────────────────");
-        let mut project_rows: Vec<ProjectRow> = hours_by_project
-            .iter()
+        // Rank on the numeric hours and only format the rows that are shown
+        let top_projects = top_by_hours(hours_by_project.into_iter().collect(), 10, |(_, (hours, _))| *hours);
+        let project_rows: Vec<ProjectRow> = top_projects
+            .into_iter()
             .map(|(project, (hours, count))| {
                 let pct = if total_hours > 0.0 { (hours / total_hours) * 100.0 } else { 0.0 };
                 ProjectRow {
-                    project: truncate(project, 20),
+                    project: truncate(&project, 20),
                     hours: format!("{:.1}h", hours),
                     items: count.to_string(),
                     percentage: format!("{:.1}%", pct),
                 }
             })
             .collect();
-        project_rows.sort_by(|a, b| {
-            let a_h: f64 = a.hours.trim_end_matches('h').parse().unwrap_or(0.0);
-            let b_h: f64 = b.hours.trim_end_matches('h').parse().unwrap_or(0.0);
-            b_h.partial_cmp(&a_h).unwrap_or(std::cmp::Ordering::Equal)
-        });
-        print_output(&project_rows.into_iter().take(10).collect::<Vec<_>>(), ctx.format)?;
+        print_output(&project_rows, ctx.format)?;
     }
 
     Ok(())
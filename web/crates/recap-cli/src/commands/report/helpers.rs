@@ -7,15 +7,22 @@ use chrono::{Datelike, NaiveDate};
 
 /// Resolve date range from optional start and end dates
 pub fn resolve_date_range(start: Option<String>, end: Option<String>) -> Result<(NaiveDate, NaiveDate)> {
-    let today = chrono::Local::now().date_naive();
+    resolve_date_range_at(start, end, chrono::Local::now().date_naive())
+}
 
+/// Resolve date range from optional start and end dates, relative to `today`
+pub fn resolve_date_range_at(
+    start: Option<String>,
+    end: Option<String>,
+    today: NaiveDate,
+) -> Result<(NaiveDate, NaiveDate)> {
     let end_date = match end {
-        Some(e) => parse_date(&e)?,
+        Some(e) => parse_date_at(&e, today)?,
         None => today,
     };
 
     let start_date = match start {
-        Some(s) => parse_date(&s)?,
+        Some(s) => parse_date_at(&s, today)?,
         None => {
             // Default to start of current month
             NaiveDate::from_ymd_opt(today.year(), today.month(), 1)
@@ -28,11 +35,16 @@ pub fn resolve_date_range(start: Option<String>, end: Option<String>) -> Result<
 
 /// Parse date string supporting common formats
 pub fn parse_date(s: &str) -> Result<NaiveDate> {
+    parse_date_at(s, chrono::Local::now().date_naive())
+}
+
+/// Parse date string, resolving "today"/"yesterday" relative to `today`
+pub fn parse_date_at(s: &str, today: NaiveDate) -> Result<NaiveDate> {
     if s == "today" {
-        return Ok(chrono::Local::now().date_naive());
+        return Ok(today);
     }
     if s == "yesterday" {
-        return Ok(chrono::Local::now().date_naive() - chrono::Duration::days(1));
+        return Ok(today - chrono::Duration::days(1));
     }
 
     NaiveDate::parse_from_str(s, "%Y-%m-%d")
@@ -52,6 +64,15 @@ pub async fn get_user_name(db: &recap_core::Database) -> Result<String> {
 mod tests {
     use super::*;
 
+    fn ymd(year: i32, month: u32, day: u32) -> NaiveDate {
+        NaiveDate::from_ymd_opt(year, month, day).unwrap()
+    }
+
+    /// Fixed "today" so defaults don't depend on the wall clock
+    fn today() -> NaiveDate {
+        ymd(2025, 8, 14)
+    }
+
     #[test]
     fn test_parse_date_valid() {
         let date = parse_date("2025-01-15").unwrap();
@@ -62,16 +83,14 @@ mod tests {
 
     #[test]
     fn test_parse_date_today() {
-        let today = chrono::Local::now().date_naive();
-        let parsed = parse_date("today").unwrap();
-        assert_eq!(parsed, today);
+        assert_eq!(parse_date_at("today", today()).unwrap(), today());
     }
 
     #[test]
     fn test_parse_date_yesterday() {
-        let yesterday = chrono::Local::now().date_naive() - chrono::Duration::days(1);
-        let parsed = parse_date("yesterday").unwrap();
-        assert_eq!(parsed, yesterday);
+        assert_eq!(parse_date_at("yesterday", today()).unwrap(), ymd(2025, 8, 13));
+        // Crosses the month boundary
+        assert_eq!(parse_date_at("yesterday", ymd(2025, 3, 1)).unwrap(), ymd(2025, 2, 28));
     }
 
     #[test]
@@ -101,51 +120,45 @@ mod tests {
 
     #[test]
     fn test_resolve_date_range_only_start() {
-        let today = chrono::Local::now().date_naive();
-        let (start, end) = resolve_date_range(
+        let (start, end) = resolve_date_range_at(
             Some("2025-01-01".to_string()),
             None,
+            today(),
         ).unwrap();
 
-        assert_eq!(start.to_string(), "2025-01-01");
-        assert_eq!(end, today);
+        assert_eq!(start, ymd(2025, 1, 1));
+        assert_eq!(end, today());
     }
 
     #[test]
     fn test_resolve_date_range_only_end() {
-        let today = chrono::Local::now().date_naive();
-        let (start, end) = resolve_date_range(
+        let (start, end) = resolve_date_range_at(
             None,
             Some("2025-01-31".to_string()),
+            today(),
         ).unwrap();
 
-        assert_eq!(start.day(), 1);
-        assert_eq!(start.month(), today.month());
-        assert_eq!(end.to_string(), "2025-01-31");
+        assert_eq!(start, ymd(2025, 8, 1));
+        assert_eq!(end, ymd(2025, 1, 31));
     }
 
     #[test]
     fn test_resolve_date_range_defaults() {
-        let result = resolve_date_range(None, None);
-        assert!(result.is_ok());
-
-        let (start, end) = result.unwrap();
-        let today = chrono::Local::now().date_naive();
+        let (start, end) = resolve_date_range_at(None, None, today()).unwrap();
 
-        assert_eq!(end, today);
-        assert_eq!(start.day(), 1);
-        assert_eq!(start.month(), today.month());
+        assert_eq!(start, ymd(2025, 8, 1));
+        assert_eq!(end, today());
     }
 
     #[test]
     fn test_resolve_date_range_with_today_keyword() {
-        let today = chrono::Local::now().date_naive();
-        let (start, end) = resolve_date_range(
+        let (start, end) = resolve_date_range_at(
             Some("today".to_string()),
             Some("today".to_string()),
+            today(),
         ).unwrap();
 
-        assert_eq!(start, today);
-        assert_eq!(end, today);
+        assert_eq!(start, today());
+        assert_eq!(end, today());
     }
 }
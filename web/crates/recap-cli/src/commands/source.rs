@@ -264,35 +264,27 @@ mod tests {
     use std::fs;
 
     #[test]
-    fn test_is_valid_git_repo_regular() {
-        // Create a temp directory with .git folder (simulating regular repo)
+    fn test_is_valid_git_repo() {
+        // One temp root holds every layout: regular repo (.git directory),
+        // worktree (.git file), plain directory, and a path that doesn't exist
         let temp_dir = TempDir::new().unwrap();
-        let git_dir = temp_dir.path().join(".git");
-        fs::create_dir(&git_dir).unwrap();
-
-        assert!(is_valid_git_repo(temp_dir.path().to_str().unwrap()));
-    }
-
-    #[test]
-    fn test_is_valid_git_repo_worktree() {
-        // Create a temp directory with .git file (simulating worktree)
-        let temp_dir = TempDir::new().unwrap();
-        let git_file = temp_dir.path().join(".git");
-        fs::write(&git_file, "gitdir: /some/path").unwrap();
-
-        assert!(is_valid_git_repo(temp_dir.path().to_str().unwrap()));
-    }
-
-    #[test]
-    fn test_is_valid_git_repo_invalid() {
-        // Create a temp directory without .git
-        let temp_dir = TempDir::new().unwrap();
-        assert!(!is_valid_git_repo(temp_dir.path().to_str().unwrap()));
-    }
-
-    #[test]
-    fn test_is_valid_git_repo_nonexistent() {
-        assert!(!is_valid_git_repo("/nonexistent/path/that/does/not/exist"));
+        let root = temp_dir.path();
+
+        fs::create_dir_all(root.join("regular/.git")).unwrap();
+        fs::create_dir(root.join("worktree")).unwrap();
+        fs::write(root.join("worktree/.git"), "gitdir: /some/path").unwrap();
+        fs::create_dir(root.join("plain")).unwrap();
+
+        let cases = [
+            ("regular", true),
+            ("worktree", true),
+            ("plain", false),
+            ("missing", false),
+        ];
+        for (name, expected) in cases {
+            let path = root.join(name);
+            assert_eq!(is_valid_git_repo(path.to_str().unwrap()), expected, "{}", name);
+        }
     }
 
     #[test]
@@ -1,45 +1,119 @@
 //! Report formatting
 //!
 //! Output formatters for tempo reports.
+//!
+//! Reports are rendered into a single buffer and written to stdout once,
+//! instead of issuing one `println!` (and one stdout lock/flush) per line.
+
+use std::fmt::Write;
+use std::io::Write as _;
 
 use super::types::TempoReport;
 
 /// Print report in plain text format
 pub fn print_text_report(report: &TempoReport) {
-    println!("╔══════════════════════════════════════════════════════════════╗");
-    println!("║  {} 工作報告", report.period);
-    println!("║  期間: {} ~ {}", report.start_date, report.end_date);
-    println!("╚══════════════════════════════════════════════════════════════╝");
-    println!();
+    write_stdout(&render_text_report(report));
+}
+
+/// Print report in markdown format
+pub fn print_markdown_report(report: &TempoReport) {
+    write_stdout(&render_markdown_report(report));
+}
+
+/// Render report in plain text format
+pub fn render_text_report(report: &TempoReport) -> String {
+    let mut out = String::new();
+    write_text_report(&mut out, report).expect("writing to a String cannot fail");
+    out
+}
+
+/// Render report in markdown format
+pub fn render_markdown_report(report: &TempoReport) -> String {
+    let mut out = String::new();
+    write_markdown_report(&mut out, report).expect("writing to a String cannot fail");
+    out
+}
+
+fn write_text_report(out: &mut String, report: &TempoReport) -> std::fmt::Result {
+    writeln!(out, "╔══════════════════════════════════════════════════════════════╗")?;
+    writeln!(out, "║  {} 工作報告", report.period)?;
+    writeln!(out, "║  期間: {} ~ {}", report.start_date, report.end_date)?;
+    writeln!(out, "╚══════════════════════════════════════════════════════════════╝")?;
+    writeln!(out)?;
 
     for project in &report.projects {
-        println!("📁 {} ({:.1} 小時)", project.project, project.hours);
+        writeln!(out, "📁 {} ({:.1} 小時)", project.project, project.hours)?;
         for summary in &project.summary {
-            println!("   • {}", summary);
+            writeln!(out, "   • {}", summary)?;
         }
-        println!();
+        writeln!(out)?;
     }
 
-    println!("───────────────────────────────────────────────────────────────");
-    println!("總計: {:.1} 小時 / {} 項工作", report.total_hours, report.total_items);
+    writeln!(out, "───────────────────────────────────────────────────────────────")?;
+    writeln!(out, "總計: {:.1} 小時 / {} 項工作", report.total_hours, report.total_items)
 }
 
-/// Print report in markdown format
-pub fn print_markdown_report(report: &TempoReport) {
-    println!("# {} 工作報告", report.period);
-    println!();
-    println!("**期間:** {} ~ {}", report.start_date, report.end_date);
-    println!();
+fn write_markdown_report(out: &mut String, report: &TempoReport) -> std::fmt::Result {
+    writeln!(out, "# {} 工作報告", report.period)?;
+    writeln!(out)?;
+    writeln!(out, "**期間:** {} ~ {}", report.start_date, report.end_date)?;
+    writeln!(out)?;
 
     for project in &report.projects {
-        println!("## {} ({:.1} 小時)", project.project, project.hours);
-        println!();
+        writeln!(out, "## {} ({:.1} 小時)", project.project, project.hours)?;
+        writeln!(out)?;
         for summary in &project.summary {
-            println!("- {}", summary);
+            writeln!(out, "- {}", summary)?;
+        }
+        writeln!(out)?;
+    }
+
+    writeln!(out, "---")?;
+    writeln!(out, "**總計:** {:.1} 小時 / {} 項工作", report.total_hours, report.total_items)
+}
+
+/// Write a rendered report to stdout with a single locked write
+fn write_stdout(rendered: &str) {
+    let stdout = std::io::stdout();
+    let mut handle = stdout.lock();
+    let _ = handle.write_all(rendered.as_bytes());
+    let _ = handle.flush();
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use super::super::types::ProjectSummary;
+
+    fn sample_report() -> TempoReport {
+        TempoReport {
+            period: "Weekly".to_string(),
+            start_date: "2025-01-13".to_string(),
+            end_date: "2025-01-19".to_string(),
+            total_hours: 6.5,
+            total_items: 3,
+            projects: vec![ProjectSummary {
+                project: "recap".to_string(),
+                hours: 6.5,
+                items: vec![],
+                summary: vec!["實作 CLI 報表".to_string(), "修復同步問題".to_string()],
+            }],
         }
-        println!();
     }
 
-    println!("---");
-    println!("**總計:** {:.1} 小時 / {} 項工作", report.total_hours, report.total_items);
+    #[test]
+    fn test_render_text_report() {
+        let text = render_text_report(&sample_report());
+        assert!(text.contains("║  Weekly 工作報告\n"));
+        assert!(text.contains("📁 recap (6.5 小時)\n   • 實作 CLI 報表\n   • 修復同步問題\n"));
+        assert!(text.ends_with("總計: 6.5 小時 / 3 項工作\n"));
+    }
+
+    #[test]
+    fn test_render_markdown_report() {
+        let md = render_markdown_report(&sample_report());
+        assert!(md.starts_with("# Weekly 工作報告\n\n**期間:** 2025-01-13 ~ 2025-01-19\n"));
+        assert!(md.contains("## recap (6.5 小時)\n\n- 實作 CLI 報表\n- 修復同步問題\n"));
+        assert!(md.ends_with("**總計:** 6.5 小時 / 3 項工作\n"));
+    }
 }
@@ -4,11 +4,15 @@
 
 use anyhow::Result;
 use std::collections::HashMap;
+use std::fmt::Write;
 
 use crate::commands::Context;
 use crate::output::print_info;
 use super::format::{print_markdown_report, print_text_report};
-use super::helpers::{clean_title, extract_project_name, generate_smart_summary, get_default_user_id};
+use super::helpers::{
+    clean_title, extract_project_name, generate_smart_summary, get_default_user_id, is_trivial_project,
+    trivial_summary,
+};
 use super::period::resolve_period;
 use super::types::{Period, ProjectSummary, TempoReport, WorkItemBrief};
 
@@ -20,17 +24,6 @@ pub async fn generate_tempo_report(
 ) -> Result<()> {
     let (start_date, end_date, period_name) = resolve_period(&period, date)?;
 
-    // Get user_id for LLM service
-    let user_id = get_default_user_id(&ctx.db).await?;
-
-    // Try to create LLM service
-    let llm_service = recap_core::create_llm_service(&ctx.db.pool, &user_id).await.ok();
-    let use_llm = llm_service.as_ref().map(|s| s.is_configured()).unwrap_or(false);
-
-    if use_llm {
-        print_info("Using LLM for smart summaries...", ctx.quiet);
-    }
-
     // Fetch work items
     let items: Vec<recap_core::WorkItem> = sqlx::query_as(
         "SELECT * FROM work_items WHERE date >= ? AND date <= ? ORDER BY date"
@@ -46,6 +39,16 @@ pub async fn generate_tempo_report(
         return Ok(());
     }
 
+    // Only resolve the user and LLM service once there is something to summarize,
+    // so empty periods return without the extra lookups
+    let user_id = get_default_user_id(&ctx.db).await?;
+    let llm_service = recap_core::create_llm_service(&ctx.db.pool, &user_id).await.ok();
+    let use_llm = llm_service.as_ref().map(|s| s.is_configured()).unwrap_or(false);
+
+    if use_llm {
+        print_info("Using LLM for smart summaries...", ctx.quiet);
+    }
+
     // Group by project
     let mut projects_map: HashMap<String, Vec<&recap_core::WorkItem>> = HashMap::new();
 
@@ -70,18 +73,12 @@ pub async fn generate_tempo_report(
             }
         }).collect();
 
-        // Generate smart summary using LLM if available
-        let summary = if use_llm {
-            let work_items_text = project_items.iter()
-                .map(|i| {
-                    let title = clean_title(&i.title);
-                    let desc = i.description.as_ref()
-                        .map(|d| format!("\n  詳情: {}", d.chars().take(500).collect::<String>()))
-                        .unwrap_or_default();
-                    format!("- {} ({:.1}h): {}{}", i.date, i.hours, title, desc)
-                })
-                .collect::<Vec<_>>()
-                .join("\n");
+        // Generate smart summary using LLM if available; with the LLM, a
+        // single short item summarizes itself instead of costing a round-trip
+        let summary = if use_llm && is_trivial_project(project_items.len(), hours) {
+            trivial_summary(project, project_items)
+        } else if use_llm {
+            let work_items_text = format_work_items_text(project_items, &items_brief);
 
             match llm_service.as_ref().unwrap().summarize_project_work(project, &work_items_text).await {
                 Ok((summaries, _usage)) => summaries,
@@ -129,3 +126,20 @@ pub async fn generate_tempo_report(
 
     Ok(())
 }
+
+/// Render the LLM prompt lines for a project into one buffer, reusing the
+/// titles already cleaned for `items_brief`
+fn format_work_items_text(items: &[&recap_core::WorkItem], briefs: &[WorkItemBrief]) -> String {
+    let mut text = String::new();
+    for (i, (item, brief)) in items.iter().zip(briefs).enumerate() {
+        if i > 0 {
+            text.push('\n');
+        }
+        let _ = write!(text, "- {} ({:.1}h): {}", brief.date, item.hours, brief.title);
+        if let Some(desc) = &item.description {
+            text.push_str("\n  詳情: ");
+            text.extend(desc.chars().take(500));
+        }
+    }
+    text
+}
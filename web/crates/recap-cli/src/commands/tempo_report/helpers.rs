@@ -3,7 +3,7 @@
 //! Shared utilities for tempo report generation.
 
 use anyhow::Result;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 /// Extract project name from title with [project] format
 pub fn extract_project_name(title: &str) -> String {
@@ -34,6 +34,30 @@ pub fn clean_title(title: &str) -> String {
     }
 }
 
+/// Projects with at most this many work items may skip the LLM summary
+pub const TRIVIAL_PROJECT_MAX_ITEMS: usize = 1;
+
+/// Projects under this many hours may skip the LLM summary
+pub const TRIVIAL_PROJECT_MAX_HOURS: f64 = 0.5;
+
+/// Whether a project is too small to be worth an LLM round-trip
+pub fn is_trivial_project(item_count: usize, hours: f64) -> bool {
+    item_count <= TRIVIAL_PROJECT_MAX_ITEMS && hours < TRIVIAL_PROJECT_MAX_HOURS
+}
+
+/// Summarize a trivial project locally from its first work item title
+pub fn trivial_summary(project: &str, items: &[&recap_core::WorkItem]) -> Vec<String> {
+    let title = items.first().map(|i| clean_title(&i.title)).unwrap_or_default();
+    if title.is_empty() {
+        vec![project.to_string()]
+    } else {
+        vec![title]
+    }
+}
+
+/// Maximum summary lines generated per project
+const MAX_SUMMARY_LINES: usize = 5;
+
 /// Generate smart summary from work items without LLM
 pub fn generate_smart_summary(items: &[&recap_core::WorkItem]) -> Vec<String> {
     let mut summaries: Vec<String> = Vec::new();
@@ -53,23 +77,40 @@ pub fn generate_smart_summary(items: &[&recap_core::WorkItem]) -> Vec<String> {
     let mut keyword_list: Vec<_> = seen_keywords.into_iter().collect();
     keyword_list.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
 
-    for (keyword, _hours) in keyword_list.iter().take(5) {
-        if !keyword.is_empty() {
-            summaries.push(format_keyword_summary(keyword, items));
-        }
-    }
+    let keyword_summaries = keyword_list
+        .iter()
+        .filter(|(keyword, _)| !keyword.is_empty())
+        .map(|(keyword, _)| format_keyword_summary(keyword, items));
+    summaries.extend(dedup_cap(keyword_summaries, MAX_SUMMARY_LINES));
 
     // If no good summaries, use titles directly
     if summaries.is_empty() {
-        for item in items.iter().take(5) {
-            let title = clean_title(&item.title);
-            if !title.is_empty() && title.len() > 3 {
-                summaries.push(title);
-            }
-        }
+        let titles = items
+            .iter()
+            .map(|item| clean_title(&item.title))
+            .filter(|title| !title.is_empty() && title.len() > 3);
+        summaries.extend(dedup_cap(titles, MAX_SUMMARY_LINES));
     }
 
-    summaries.into_iter().take(5).collect()
+    summaries
+}
+
+/// Keep the first `cap` distinct items in order, stopping as soon as the cap is reached
+pub fn dedup_cap<I>(items: I, cap: usize) -> Vec<String>
+where
+    I: IntoIterator<Item = String>,
+{
+    let mut seen: HashSet<String> = HashSet::new();
+    let mut out = Vec::new();
+    for item in items {
+        if out.len() == cap {
+            break;
+        }
+        if seen.insert(item.clone()) {
+            out.push(item);
+        }
+    }
+    out
 }
 
 /// Extract keywords from title for grouping
@@ -211,4 +252,19 @@ mod tests {
         assert!(cleaned.len() <= 63); // 57 chars + "..."
         assert!(cleaned.ends_with("..."));
     }
+
+    #[test]
+    fn test_is_trivial_project() {
+        assert!(is_trivial_project(0, 0.0));
+        assert!(is_trivial_project(1, 0.25));
+        assert!(!is_trivial_project(1, 0.5));
+        assert!(!is_trivial_project(2, 0.25));
+    }
+
+    #[test]
+    fn test_dedup_cap_keeps_first_occurrences() {
+        let items = ["b", "a", "b", "c", "a", "d"].iter().map(|s| s.to_string());
+        assert_eq!(dedup_cap(items.clone(), 3), vec!["b", "a", "c"]);
+        assert_eq!(dedup_cap(items, 10), vec!["b", "a", "c", "d"]);
+    }
 }
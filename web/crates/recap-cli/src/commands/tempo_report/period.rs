@@ -9,8 +9,15 @@ use super::types::Period;
 
 /// Resolve a period specification to a date range
 pub fn resolve_period(period: &Period, date: Option<String>) -> Result<(NaiveDate, NaiveDate, String)> {
-    let today = chrono::Local::now().date_naive();
+    resolve_period_at(period, date, chrono::Local::now().date_naive())
+}
 
+/// Resolve a period specification to a date range, relative to `today`
+pub fn resolve_period_at(
+    period: &Period,
+    date: Option<String>,
+    today: NaiveDate,
+) -> Result<(NaiveDate, NaiveDate, String)> {
     match period {
         Period::Daily => {
             let target = match date {
@@ -126,6 +133,15 @@ pub fn parse_half(s: &str) -> Result<(i32, u32)> {
 mod tests {
     use super::*;
 
+    fn ymd(year: i32, month: u32, day: u32) -> NaiveDate {
+        NaiveDate::from_ymd_opt(year, month, day).unwrap()
+    }
+
+    /// Fixed "today" for default-period tests: a Thursday in Q3 / H2
+    fn today() -> NaiveDate {
+        ymd(2025, 8, 14)
+    }
+
     #[test]
     fn test_parse_quarter_valid() {
         assert_eq!(parse_quarter("2026-Q1").unwrap(), (2026, 1));
@@ -170,49 +186,59 @@ mod tests {
 
     #[test]
     fn test_resolve_period_daily_default() {
-        let today = chrono::Local::now().date_naive();
-        let (start, end, name) = resolve_period(&Period::Daily, None).unwrap();
-        assert_eq!(start, today);
-        assert_eq!(end, today);
+        let (start, end, name) = resolve_period_at(&Period::Daily, None, today()).unwrap();
+        assert_eq!(start, today());
+        assert_eq!(end, today());
         assert!(name.contains("Daily"));
     }
 
     #[test]
     fn test_resolve_period_daily_specific() {
         let (start, end, _) = resolve_period(&Period::Daily, Some("2025-06-15".to_string())).unwrap();
-        assert_eq!(start.to_string(), "2025-06-15");
-        assert_eq!(end.to_string(), "2025-06-15");
+        assert_eq!(start, ymd(2025, 6, 15));
+        assert_eq!(end, ymd(2025, 6, 15));
     }
 
     #[test]
     fn test_resolve_period_weekly_default() {
-        let (start, end, name) = resolve_period(&Period::Weekly, None).unwrap();
-        // Should be 7 days span
-        let days = (end - start).num_days();
-        assert_eq!(days, 6);
+        let (start, end, name) = resolve_period_at(&Period::Weekly, None, today()).unwrap();
+        // Should be the Monday-to-Sunday span containing today
+        assert_eq!(start, ymd(2025, 8, 11));
+        assert_eq!(end, ymd(2025, 8, 17));
+        assert_eq!(start.weekday(), chrono::Weekday::Mon);
         assert!(name.contains("Weekly"));
     }
 
     #[test]
     fn test_resolve_period_monthly_default() {
-        let today = chrono::Local::now().date_naive();
-        let (start, _end, name) = resolve_period(&Period::Monthly, None).unwrap();
-        assert_eq!(start.day(), 1);
-        assert_eq!(start.month(), today.month());
+        let (start, end, name) = resolve_period_at(&Period::Monthly, None, today()).unwrap();
+        assert_eq!(start, ymd(2025, 8, 1));
+        assert_eq!(end, ymd(2025, 8, 31));
         assert!(name.contains("Monthly"));
     }
 
     #[test]
     fn test_resolve_period_monthly_specific() {
-        let (start, end, _) = resolve_period(&Period::Monthly, Some("2025-02".to_string())).unwrap();
-        assert_eq!(start.to_string(), "2025-02-01");
-        assert_eq!(end.to_string(), "2025-02-28");
+        // (month, expected start, expected end): plain, leap/non-leap February, year rollover
+        let cases = [
+            ("2025-01", ymd(2025, 1, 1), ymd(2025, 1, 31)),
+            ("2024-02", ymd(2024, 2, 1), ymd(2024, 2, 29)),
+            ("2025-02", ymd(2025, 2, 1), ymd(2025, 2, 28)),
+            ("2025-04", ymd(2025, 4, 1), ymd(2025, 4, 30)),
+            ("2025-12", ymd(2025, 12, 1), ymd(2025, 12, 31)),
+        ];
+        for (month, expected_start, expected_end) in cases {
+            let (start, end, name) = resolve_period(&Period::Monthly, Some(month.to_string())).unwrap();
+            assert_eq!((start, end), (expected_start, expected_end), "month {}", month);
+            assert!(name.contains(month), "name {:?} for {}", name, month);
+        }
     }
 
     #[test]
     fn test_resolve_period_quarterly_default() {
-        let (start, _end, name) = resolve_period(&Period::Quarterly, None).unwrap();
-        assert_eq!(start.day(), 1);
+        let (start, end, name) = resolve_period_at(&Period::Quarterly, None, today()).unwrap();
+        assert_eq!(start, ymd(2025, 7, 1));
+        assert_eq!(end, ymd(2025, 9, 30));
         assert!(name.contains("Quarterly"));
         assert!(name.contains("-Q"));
     }
@@ -220,14 +246,15 @@ mod tests {
     #[test]
     fn test_resolve_period_quarterly_specific() {
         let (start, end, _) = resolve_period(&Period::Quarterly, Some("2025-Q1".to_string())).unwrap();
-        assert_eq!(start.to_string(), "2025-01-01");
-        assert_eq!(end.to_string(), "2025-03-31");
+        assert_eq!(start, ymd(2025, 1, 1));
+        assert_eq!(end, ymd(2025, 3, 31));
     }
 
     #[test]
     fn test_resolve_period_semiannual_default() {
-        let (start, _end, name) = resolve_period(&Period::SemiAnnual, None).unwrap();
-        assert_eq!(start.day(), 1);
+        let (start, end, name) = resolve_period_at(&Period::SemiAnnual, None, today()).unwrap();
+        assert_eq!(start, ymd(2025, 7, 1));
+        assert_eq!(end, ymd(2025, 12, 31));
         assert!(name.contains("Semi-Annual"));
         assert!(name.contains("-H"));
     }
@@ -235,14 +262,14 @@ mod tests {
     #[test]
     fn test_resolve_period_semiannual_h1() {
         let (start, end, _) = resolve_period(&Period::SemiAnnual, Some("2025-H1".to_string())).unwrap();
-        assert_eq!(start.to_string(), "2025-01-01");
-        assert_eq!(end.to_string(), "2025-06-30");
+        assert_eq!(start, ymd(2025, 1, 1));
+        assert_eq!(end, ymd(2025, 6, 30));
     }
 
     #[test]
     fn test_resolve_period_semiannual_h2() {
         let (start, end, _) = resolve_period(&Period::SemiAnnual, Some("2025-H2".to_string())).unwrap();
-        assert_eq!(start.to_string(), "2025-07-01");
-        assert_eq!(end.to_string(), "2025-12-31");
+        assert_eq!(start, ymd(2025, 7, 1));
+        assert_eq!(end, ymd(2025, 12, 31));
     }
 }
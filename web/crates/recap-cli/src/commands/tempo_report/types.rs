@@ -22,6 +22,9 @@ pub enum Period {
 #[derive(Subcommand)]
 pub enum TempoReportAction {
     /// Generate smart work summary for Tempo
+    ///
+    /// When the LLM is used, projects with a single work item under 0.5 hours
+    /// are summarized from that item's title instead of calling it.
     Generate {
         /// Report period granularity
         #[arg(short, long, value_enum, default_value = "weekly")]
@@ -208,3 +208,54 @@ fn init_logging(log_file_path: Option<&str>) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use clap::CommandFactory;
+
+    #[test]
+    fn test_cli_definition_is_valid() {
+        Cli::command().debug_assert();
+    }
+
+    #[test]
+    fn test_subcommands_registered_with_help() {
+        let subcommands = [
+            ("work", "list"),
+            ("work", "add"),
+            ("report", "summary"),
+            ("report", "export"),
+            ("sync", "run"),
+            ("sync", "status"),
+            ("source", "list"),
+            ("source", "add"),
+            ("config", "show"),
+            ("config", "get"),
+            ("config", "set"),
+            ("dashboard", "stats"),
+            ("dashboard", "timeline"),
+            ("dashboard", "heatmap"),
+            ("dashboard", "projects"),
+            ("tempo", "generate"),
+        ];
+
+        let mut cli = Cli::command();
+        for (group, name) in subcommands {
+            let group_command = cli
+                .find_subcommand_mut(group)
+                .unwrap_or_else(|| panic!("missing command group: {}", group));
+            let registered: Vec<&str> = group_command.get_subcommands().map(|c| c.get_name()).collect();
+            assert!(registered.contains(&name), "missing subcommand: {} {}", group, name);
+
+            // Match the command column of a whole help line, not any substring
+            let help = group_command.render_help().to_string();
+            assert!(
+                help.lines().any(|line| line.split_whitespace().next() == Some(name)),
+                "help for {} should list {}",
+                group,
+                name
+            );
+        }
+    }
+}
@@ -2,6 +2,7 @@
 //! Supports OpenAI, Anthropic, Ollama, and OpenAI-compatible APIs
 
 use serde::{Deserialize, Serialize};
+use std::sync::OnceLock;
 use std::time::{Duration, Instant};
 
 #[derive(Debug, Clone)]
@@ -239,15 +240,32 @@ pub struct LlmService {
 /// smaller models (e.g. gpt-5-nano), so 120s provides adequate headroom.
 const LLM_REQUEST_TIMEOUT: Duration = Duration::from_secs(120);
 
+/// Max worklog descriptions summarized in one `summarize_worklogs` request,
+/// keeping the prompt and the numbered response within a single completion
+pub const MAX_WORKLOG_BATCH: usize = 20;
+
+/// Process-wide HTTP client shared by every `LlmService`.
+///
+/// Commands build a fresh service per call (e.g. one per worklog summary), so
+/// constructing the client (and its TLS config) once and cloning the handle
+/// keeps that cost out of the per-call path.
+fn shared_client() -> reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT
+        .get_or_init(|| {
+            reqwest::Client::builder()
+                .timeout(LLM_REQUEST_TIMEOUT)
+                .build()
+                .unwrap_or_else(|_| reqwest::Client::new())
+        })
+        .clone()
+}
+
 impl LlmService {
     pub fn new(config: LlmConfig) -> Self {
-        let client = reqwest::Client::builder()
-            .timeout(LLM_REQUEST_TIMEOUT)
-            .build()
-            .unwrap_or_else(|_| reqwest::Client::new());
         Self {
             config,
-            client,
+            client: shared_client(),
         }
     }
 
@@ -519,6 +537,49 @@ Git Commits:
         self.complete_with_usage(&prompt, "worklog_description", 200).await
     }
 
+    /// Summarize several worklog descriptions for Tempo upload in a single request.
+    /// The response holds one numbered line per description (`1. ...`); split it
+    /// with `parse_numbered_lines`. Callers chunk their input to at most
+    /// `MAX_WORKLOG_BATCH` descriptions per call.
+    pub async fn summarize_worklogs(&self, descriptions: &[&str]) -> Result<(String, LlmUsageRecord), String> {
+        if descriptions.len() > MAX_WORKLOG_BATCH {
+            return Err(format!(
+                "Too many worklogs in one summary batch: {} (max {})",
+                descriptions.len(),
+                MAX_WORKLOG_BATCH
+            ));
+        }
+
+        let items = descriptions
+            .iter()
+            .enumerate()
+            .map(|(i, d)| format!("{}. {}", i + 1, d.chars().take(1000).collect::<String>().replace('\n', " ")))
+            .collect::<Vec<_>>()
+            .join("\n");
+
+        let prompt = format!(
+            r#"將以下 {count} 則工作日誌各濃縮成一句 Jira worklog 描述（每句最多 50 字）。
+
+規則：
+- 共輸出 {count} 行，每行格式為「編號. 描述」，編號與工作日誌編號對應
+- 不加 markdown、不加其他說明
+- 格式：動詞 + 具體物件（如：修正 `tempo.rs` auth type 判斷、新增批次匯出功能）
+- 必須包含具體的檔案名、模組名或功能名
+- 禁止空泛用語（「提升穩定性」「優化流程」「強化控管」）
+- 不要出現 IP、密碼、API Key、Token 等機密
+
+工作日誌：
+{items}
+
+直接輸出。"#,
+            count = descriptions.len(),
+            items = items
+        );
+
+        let max_tokens = 200 * descriptions.len() as u32;
+        self.complete_with_usage(&prompt, "worklog_description", max_tokens).await
+    }
+
     /// Send completion request to LLM and return usage record.
     /// `max_tokens` controls the maximum output tokens for the API call.
     pub async fn complete_with_usage(&self, prompt: &str, purpose: &str, max_tokens: u32) -> Result<(String, LlmUsageRecord), String> {
@@ -890,6 +951,38 @@ pub fn parse_error_usage(err: &str) -> Option<LlmUsageRecord> {
     }
 }
 
+/// Split a numbered LLM response (`1. ...`, `2) ...`) into `count` entries.
+/// Returns None unless the numbered lines run exactly 1 to `count` in order,
+/// each non-empty: a dropped, repeated or reordered line would otherwise pair
+/// a summary with the wrong input. Unnumbered lines are ignored.
+pub fn parse_numbered_lines(text: &str, count: usize) -> Option<Vec<String>> {
+    let mut lines: Vec<String> = Vec::with_capacity(count);
+
+    for line in text.lines() {
+        let line = line.trim();
+        let digits = line.len() - line.trim_start_matches(|c: char| c.is_ascii_digit()).len();
+        if digits == 0 {
+            continue;
+        }
+        let rest = &line[digits..];
+        let rest = match rest
+            .strip_prefix('.')
+            .or_else(|| rest.strip_prefix(')'))
+            .or_else(|| rest.strip_prefix('、'))
+        {
+            Some(r) => r.trim(),
+            None => continue,
+        };
+        let n = line[..digits].parse::<usize>().ok()?;
+        if n != lines.len() + 1 || n > count || rest.is_empty() {
+            return None;
+        }
+        lines.push(rest.to_string());
+    }
+
+    (lines.len() == count).then_some(lines)
+}
+
 /// Extract text content from a Responses API output array.
 /// Returns the concatenated text from all message items with output_text/text content.
 fn extract_responses_text(output: &[ResponsesOutputItem]) -> String {
@@ -1351,62 +1444,71 @@ mod tests {
         assert!(parse_error_usage("LLM_ERROR:no-double-colon-separator").is_none());
     }
 
-    // ==================== LlmService::is_configured tests ====================
+    // ==================== parse_numbered_lines tests ====================
 
     #[test]
-    fn test_is_configured_openai_with_key() {
-        let service = LlmService::new(LlmConfig {
-            provider: "openai".to_string(),
-            model: "gpt-5".to_string(),
-            api_key: Some("sk-test".to_string()),
-            base_url: None,
-            summary_max_chars: 2000,
-            reasoning_effort: None,
-            summary_prompt: None,
-        });
-        assert!(service.is_configured());
+    fn test_parse_numbered_lines() {
+        let text = "1. 修正 tempo.rs auth 判斷\n2) 新增批次匯出\n3、更新 README";
+        let lines = parse_numbered_lines(text, 3).unwrap();
+        assert_eq!(lines, vec!["修正 tempo.rs auth 判斷", "新增批次匯出", "更新 README"]);
     }
 
     #[test]
-    fn test_is_configured_openai_without_key() {
-        let service = LlmService::new(LlmConfig {
-            provider: "openai".to_string(),
-            model: "gpt-5".to_string(),
-            api_key: None,
-            base_url: None,
-            summary_max_chars: 2000,
-            reasoning_effort: None,
-            summary_prompt: None,
-        });
-        assert!(!service.is_configured());
+    fn test_parse_numbered_lines_ignores_noise() {
+        let text = "以下是摘要：\n\n1. 第一項\n2. 第二項\n";
+        let lines = parse_numbered_lines(text, 2).unwrap();
+        assert_eq!(lines, vec!["第一項", "第二項"]);
     }
 
     #[test]
-    fn test_is_configured_ollama_without_key() {
-        let service = LlmService::new(LlmConfig {
-            provider: "ollama".to_string(),
-            model: "llama3".to_string(),
-            api_key: None,
-            base_url: None,
-            summary_max_chars: 2000,
-            reasoning_effort: None,
-            summary_prompt: None,
-        });
-        assert!(service.is_configured());
+    fn test_parse_numbered_lines_rejects_misnumbered() {
+        let cases = [
+            ("2. 第二項\n1. 第一項", 2), // reordered
+            ("1. 第一項\n3. 第三項", 3),  // dropped line
+            ("1. 第一項\n1. 重複\n2. 第二項", 2), // repeated number
+            ("1. 第一項\n2. 第二項\n3. 多出來", 2), // extra line
+        ];
+        for (text, count) in cases {
+            assert!(parse_numbered_lines(text, count).is_none(), "{:?}", text);
+        }
     }
 
     #[test]
-    fn test_is_configured_anthropic_without_key() {
-        let service = LlmService::new(LlmConfig {
-            provider: "anthropic".to_string(),
-            model: "claude-3-5-sonnet".to_string(),
-            api_key: None,
-            base_url: None,
-            summary_max_chars: 2000,
-            reasoning_effort: None,
-            summary_prompt: None,
-        });
-        assert!(!service.is_configured());
+    fn test_parse_numbered_lines_count_mismatch() {
+        assert!(parse_numbered_lines("1. 只有一項", 2).is_none());
+        assert!(parse_numbered_lines("1. 第一項\n2.   ", 2).is_none());
+        assert!(parse_numbered_lines("", 1).is_none());
+    }
+
+    // ==================== LlmService::is_configured tests ====================
+
+    #[test]
+    fn test_is_configured() {
+        let cases = [
+            ("openai", "gpt-5", Some("sk-test"), true),
+            ("openai", "gpt-5", None, false),
+            ("ollama", "llama3", None, true),
+            ("anthropic", "claude-3-5-sonnet", None, false),
+        ];
+
+        for (provider, model, api_key, expected) in cases {
+            let service = LlmService::new(LlmConfig {
+                provider: provider.to_string(),
+                model: model.to_string(),
+                api_key: api_key.map(|k| k.to_string()),
+                base_url: None,
+                summary_max_chars: 2000,
+                reasoning_effort: None,
+                summary_prompt: None,
+            });
+            assert_eq!(
+                service.is_configured(),
+                expected,
+                "{} with key {:?}",
+                provider,
+                api_key
+            );
+        }
     }
 
     // ==================== Responses API usage token calculation tests ====================
@@ -5,12 +5,14 @@
 //! - Sync service (services/sync.rs)
 //! - Work items (commands/work_items.rs)
 
+use memchr::memmem;
 use serde::Deserialize;
 use sha2::{Digest, Sha256};
 use std::collections::HashMap;
 use std::fs;
 use std::io::{BufRead, BufReader};
 use std::path::PathBuf;
+use std::sync::OnceLock;
 
 // ============ Hash Generation ============
 
@@ -26,12 +28,17 @@ pub fn generate_daily_hash(user_id: &str, project: &str, date: &str) -> String {
 // ============ Message Validation ============
 
 /// Check if a message is meaningful (not warmup, not system commands, has content)
+///
+/// Prefixes are matched case-insensitively in place, so long pasted messages
+/// aren't lowercased into a fresh copy just to inspect their first few bytes.
 pub fn is_meaningful_message(content: &str) -> bool {
-    let trimmed = content.trim().to_lowercase();
-    if trimmed == "warmup" || trimmed.starts_with("warmup") {
-        return false;
-    }
-    if trimmed.starts_with("<command-") || trimmed.starts_with("<system-") {
+    let trimmed = content.trim();
+    let starts_with = |prefix: &str| {
+        trimmed
+            .get(..prefix.len())
+            .is_some_and(|head| head.eq_ignore_ascii_case(prefix))
+    };
+    if starts_with("warmup") || starts_with("<command-") || starts_with("<system-") {
         return false;
     }
     trimmed.len() >= 10
@@ -140,20 +147,57 @@ pub struct ParsedSession {
     pub first_message: Option<String>,
 }
 
+// ============ Line Reading ============
+
+/// Read buffer for session files, which can grow to hundreds of MB
+pub const SESSION_READ_BUFFER: usize = 1 << 20;
+
+/// Read the next JSONL line into `buf` as raw bytes, returning false at EOF.
+///
+/// Reusing one buffer and handing bytes to `serde_json::from_slice` avoids the
+/// per-line `String` allocation and separate UTF-8 pass of `BufRead::lines`.
+pub fn read_session_line<R: BufRead>(reader: &mut R, buf: &mut Vec<u8>) -> bool {
+    buf.clear();
+    matches!(reader.read_until(b'\n', buf), Ok(n) if n > 0)
+}
+
+/// Whether a raw JSONL line contains a `"timestamp"` key.
+///
+/// Large tool-result lines often have no top-level timestamp; callers that
+/// discard such lines can check this first and skip the JSON decode.
+pub fn line_has_timestamp(line: &[u8]) -> bool {
+    static FINDER: OnceLock<memmem::Finder<'static>> = OnceLock::new();
+    FINDER
+        .get_or_init(|| memmem::Finder::new(b"\"timestamp\""))
+        .find(line)
+        .is_some()
+}
+
 // ============ CWD Extraction ============
 
+/// Only the `cwd` field of a session line, so other fields are skipped
+/// rather than built into a `serde_json::Value` tree
+#[derive(Debug, Deserialize)]
+struct CwdOnly {
+    cwd: Option<String>,
+}
+
 /// Lightweight extraction of `cwd` from a JSONL session file.
 /// Scans up to 100 lines to find the first line containing a `cwd` field,
-/// without performing full session parsing.
+/// without performing full session parsing. Lines that don't mention
+/// `"cwd"` at all are skipped without being parsed.
 pub fn extract_cwd(path: &PathBuf) -> Option<String> {
     let file = fs::File::open(path).ok()?;
     let reader = BufReader::new(file);
 
     for line in reader.lines().take(100).flatten() {
-        if let Ok(msg) = serde_json::from_str::<serde_json::Value>(&line) {
-            if let Some(cwd) = msg.get("cwd").and_then(|v| v.as_str()) {
+        if !line.contains("\"cwd\"") {
+            continue;
+        }
+        if let Ok(msg) = serde_json::from_str::<CwdOnly>(&line) {
+            if let Some(cwd) = msg.cwd {
                 if !cwd.is_empty() {
-                    return Some(cwd.to_string());
+                    return Some(cwd);
                 }
             }
         }
@@ -168,7 +212,8 @@ pub fn extract_cwd(path: &PathBuf) -> Option<String> {
 /// Used by timeline display where full parsing is not needed
 pub fn parse_session_fast(path: &PathBuf) -> Option<SessionMetadata> {
     let file = fs::File::open(path).ok()?;
-    let reader = BufReader::new(file);
+    let mut reader = BufReader::with_capacity(SESSION_READ_BUFFER, file);
+    let mut line = Vec::new();
 
     let mut cwd: Option<String> = None;
     let mut first_ts: Option<String> = None;
@@ -176,8 +221,8 @@ pub fn parse_session_fast(path: &PathBuf) -> Option<SessionMetadata> {
     let mut first_msg: Option<String> = None;
     let mut message_count: usize = 0;
 
-    for line in reader.lines().flatten() {
-        if let Ok(msg) = serde_json::from_str::<SessionMessage>(&line) {
+    while read_session_line(&mut reader, &mut line) {
+        if let Ok(msg) = serde_json::from_slice::<SessionMessage>(&line) {
             // Extract cwd from first message that has it
             if cwd.is_none() {
                 cwd = msg.cwd;
@@ -235,7 +280,8 @@ pub fn parse_session_fast(path: &PathBuf) -> Option<SessionMetadata> {
 /// Used by sync operations where full data is needed
 pub fn parse_session_full(path: &PathBuf) -> Option<ParsedSession> {
     let file = fs::File::open(path).ok()?;
-    let reader = BufReader::new(file);
+    let mut reader = BufReader::with_capacity(SESSION_READ_BUFFER, file);
+    let mut line = Vec::new();
 
     let mut cwd: Option<String> = None;
     let mut first_message: Option<String> = None;
@@ -246,8 +292,8 @@ pub fn parse_session_full(path: &PathBuf) -> Option<ParsedSession> {
     let mut tool_counts: HashMap<String, usize> = HashMap::new();
     let mut files_modified: Vec<String> = Vec::new();
 
-    for line in reader.lines().flatten() {
-        if let Ok(msg) = serde_json::from_str::<SessionMessage>(&line) {
+    while read_session_line(&mut reader, &mut line) {
+        if let Ok(msg) = serde_json::from_slice::<SessionMessage>(&line) {
             if cwd.is_none() {
                 cwd = msg.cwd;
             }
@@ -331,11 +377,57 @@ pub fn parse_session_full(path: &PathBuf) -> Option<ParsedSession> {
     })
 }
 
+/// Parse many session files with `parse_session_full` across worker threads.
+/// Files are independent and parsing is CPU-bound, so each thread takes a
+/// contiguous chunk. Results come back in input order, paired with their path.
+pub fn parse_sessions_parallel(paths: Vec<PathBuf>) -> Vec<(PathBuf, Option<ParsedSession>)> {
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(paths.len());
+
+    let parsed: Vec<Option<ParsedSession>> = if workers <= 1 {
+        paths.iter().map(parse_session_full).collect()
+    } else {
+        let chunk_size = paths.len().div_ceil(workers);
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = paths
+                .chunks(chunk_size)
+                .map(|chunk| scope.spawn(move || chunk.iter().map(parse_session_full).collect::<Vec<_>>()))
+                .collect();
+            handles
+                .into_iter()
+                .flat_map(|h| h.join().expect("session parser thread panicked"))
+                .collect()
+        })
+    };
+
+    paths.into_iter().zip(parsed).collect()
+}
+
 // ============ Tests ============
 
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::path::Path;
+
+    /// Scratch directory shared by the file-based tests, created once per run;
+    /// each test writes its own uniquely named files into it
+    fn scratch_dir() -> &'static Path {
+        static DIR: OnceLock<PathBuf> = OnceLock::new();
+        DIR.get_or_init(|| {
+            let dir = std::env::temp_dir().join("recap_session_parser_tests");
+            fs::create_dir_all(&dir).unwrap();
+            dir
+        })
+    }
+
+    fn write_session_file(name: &str, content: &str) -> PathBuf {
+        let path = scratch_dir().join(name);
+        fs::write(&path, content).unwrap();
+        path
+    }
 
     #[test]
     fn test_generate_daily_hash_consistent() {
@@ -368,6 +460,7 @@ mod tests {
     fn test_is_meaningful_message_system() {
         assert!(!is_meaningful_message("<command-name>test</command-name>"));
         assert!(!is_meaningful_message("<system-reminder>test</system-reminder>"));
+        assert!(!is_meaningful_message("  <Command-Name>test</Command-Name>"));
     }
 
     #[test]
@@ -397,54 +490,42 @@ mod tests {
 
     #[test]
     fn test_extract_cwd_first_line_has_cwd() {
-        let dir = std::env::temp_dir().join("recap_test_cwd_1");
-        let _ = fs::create_dir_all(&dir);
-        let file_path = dir.join("test.jsonl");
-        fs::write(
-            &file_path,
+        let file_path = write_session_file(
+            "cwd_first_line.jsonl",
             r#"{"cwd":"/Users/foo/project","type":"human","timestamp":"2026-01-01T00:00:00Z"}
 {"type":"assistant","timestamp":"2026-01-01T00:01:00Z"}
 "#,
-        )
-        .unwrap();
+        );
         let result = extract_cwd(&file_path);
         assert_eq!(result, Some("/Users/foo/project".to_string()));
-        let _ = fs::remove_dir_all(&dir);
+        let _ = fs::remove_file(&file_path);
     }
 
     #[test]
     fn test_extract_cwd_summary_first_line() {
-        let dir = std::env::temp_dir().join("recap_test_cwd_2");
-        let _ = fs::create_dir_all(&dir);
-        let file_path = dir.join("test.jsonl");
-        fs::write(
-            &file_path,
+        let file_path = write_session_file(
+            "cwd_summary_first.jsonl",
             r#"{"type":"summary","timestamp":"2026-01-01T00:00:00Z"}
 {"type":"progress","timestamp":"2026-01-01T00:01:00Z"}
 {"cwd":"/Users/bar/deep/project","type":"human","timestamp":"2026-01-01T00:02:00Z"}
 "#,
-        )
-        .unwrap();
+        );
         let result = extract_cwd(&file_path);
         assert_eq!(result, Some("/Users/bar/deep/project".to_string()));
-        let _ = fs::remove_dir_all(&dir);
+        let _ = fs::remove_file(&file_path);
     }
 
     #[test]
     fn test_extract_cwd_no_cwd_field() {
-        let dir = std::env::temp_dir().join("recap_test_cwd_3");
-        let _ = fs::create_dir_all(&dir);
-        let file_path = dir.join("test.jsonl");
-        fs::write(
-            &file_path,
+        let file_path = write_session_file(
+            "cwd_missing_field.jsonl",
             r#"{"type":"summary","timestamp":"2026-01-01T00:00:00Z"}
 {"type":"progress","timestamp":"2026-01-01T00:01:00Z"}
 "#,
-        )
-        .unwrap();
+        );
         let result = extract_cwd(&file_path);
         assert!(result.is_none());
-        let _ = fs::remove_dir_all(&dir);
+        let _ = fs::remove_file(&file_path);
     }
 
     #[test]
@@ -454,6 +535,58 @@ mod tests {
         assert!(result.is_none());
     }
 
+    #[test]
+    fn test_line_has_timestamp() {
+        assert!(line_has_timestamp(br#"{"type":"user","timestamp":"2026-01-01T00:00:00Z"}"#));
+        assert!(!line_has_timestamp(br#"{"type":"summary","summary":"no time here"}"#));
+        assert!(!line_has_timestamp(b""));
+    }
+
+    #[test]
+    fn test_read_session_line() {
+        let data = b"{\"a\":1}\n\n{\"b\":2}";
+        let mut reader = std::io::Cursor::new(&data[..]);
+        let mut line = Vec::new();
+
+        assert!(read_session_line(&mut reader, &mut line));
+        assert_eq!(line, b"{\"a\":1}\n");
+        assert!(read_session_line(&mut reader, &mut line));
+        assert_eq!(line, b"\n");
+        assert!(read_session_line(&mut reader, &mut line));
+        assert_eq!(line, b"{\"b\":2}");
+        assert!(!read_session_line(&mut reader, &mut line));
+    }
+
+    #[test]
+    fn test_parse_sessions_parallel_preserves_order() {
+        let paths: Vec<PathBuf> = (0..5)
+            .map(|i| {
+                write_session_file(
+                    &format!("parallel-{}.jsonl", i),
+                    &format!(
+                        r#"{{"cwd":"/Users/foo/project-{}","type":"user","timestamp":"2026-01-0{}T00:00:00Z"}}
+"#,
+                        i,
+                        i + 1
+                    ),
+                )
+            })
+            .chain(std::iter::once(scratch_dir().join("parallel-missing.jsonl")))
+            .collect();
+
+        let results = parse_sessions_parallel(paths.clone());
+
+        assert_eq!(results.len(), 6);
+        for (i, (path, parsed)) in results.iter().enumerate().take(5) {
+            assert_eq!(path, &paths[i]);
+            assert_eq!(parsed.as_ref().unwrap().cwd, format!("/Users/foo/project-{}", i));
+        }
+        assert!(results[5].1.is_none());
+        for path in &paths {
+            let _ = fs::remove_file(path);
+        }
+    }
+
     #[test]
     fn test_extract_tool_detail_long_command() {
         let long_cmd = "a".repeat(100);
@@ -5,19 +5,20 @@
 //! assistant responses, tool calls, files modified, and git commits
 //! for a specific session within a one-hour window.
 
-use chrono::{DateTime, Local, Timelike};
+use chrono::{DateTime, Datelike, Local, Timelike};
 use serde::{Deserialize, Serialize};
 use sqlx::SqlitePool;
 use std::collections::HashMap;
 use std::fs;
-use std::io::{BufRead, BufReader};
+use std::io::BufReader;
 use std::path::PathBuf;
 
 use crate::utils::create_command;
 use uuid::Uuid;
 
 use super::session_parser::{
-    extract_tool_detail, is_meaningful_message, SessionMessage, ToolUseContent,
+    extract_tool_detail, is_meaningful_message, line_has_timestamp, read_session_line, SessionMessage,
+    ToolUseContent, SESSION_READ_BUFFER,
 };
 use super::sync::DiscoveredProject;
 use super::worklog::{get_commits_in_time_range, get_git_user_email};
@@ -69,14 +70,18 @@ pub struct SnapshotCaptureResult {
 ///
 /// Converts UTC to local timezone so that hour bucketing and date grouping
 /// align with the user's actual working hours.
+///
+/// Runs once per JSONL line, so the key is written directly from the date and
+/// hour fields rather than through a strftime-style format string.
 fn truncate_to_hour(timestamp: &str) -> Option<String> {
-    let dt = DateTime::parse_from_rfc3339(timestamp).ok()?;
-    let local_dt = dt.with_timezone(&Local);
-    let truncated = local_dt
-        .with_minute(0)
-        .and_then(|d| d.with_second(0))
-        .and_then(|d| d.with_nanosecond(0))?;
-    Some(truncated.format("%Y-%m-%dT%H:%M:%S").to_string())
+    let local_dt = DateTime::parse_from_rfc3339(timestamp).ok()?.with_timezone(&Local);
+    Some(format!(
+        "{:04}-{:02}-{:02}T{:02}:00:00",
+        local_dt.year(),
+        local_dt.month(),
+        local_dt.day(),
+        local_dt.hour()
+    ))
 }
 
 /// Parse a JSONL session file into hourly buckets.
@@ -88,18 +93,23 @@ pub fn parse_session_into_hourly_buckets(path: &PathBuf) -> Vec<HourlyBucket> {
         Ok(f) => f,
         Err(_) => return Vec::new(),
     };
-    let reader = BufReader::new(file);
+    let mut reader = BufReader::with_capacity(SESSION_READ_BUFFER, file);
+    let mut line = Vec::new();
 
     let mut buckets: HashMap<String, HourlyBucket> = HashMap::new();
 
-    for line in reader.lines().flatten() {
-        let msg: SessionMessage = match serde_json::from_str(&line) {
+    while read_session_line(&mut reader, &mut line) {
+        // Lines without a timestamp can't be bucketed; don't bother decoding them
+        if !line_has_timestamp(&line) {
+            continue;
+        }
+        let msg: SessionMessage = match serde_json::from_slice(&line) {
             Ok(m) => m,
             Err(_) => continue,
         };
 
-        let timestamp = match &msg.timestamp {
-            Some(ts) => ts.clone(),
+        let timestamp = match msg.timestamp {
+            Some(ts) => ts,
             None => continue,
         };
 
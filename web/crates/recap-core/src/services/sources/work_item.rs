@@ -45,8 +45,9 @@ impl UpsertResult {
 /// Generate a content hash for session-based deduplication.
 ///
 /// Uses user_id + session_id for uniqueness, as session_id is a UUID
-/// and already globally unique.
-fn generate_session_hash(user_id: &str, session_id: &str) -> String {
+/// and already globally unique. Shared with the legacy Claude sync in
+/// `services::sync`.
+pub(crate) fn generate_session_hash(user_id: &str, session_id: &str) -> String {
     use std::collections::hash_map::DefaultHasher;
     use std::hash::{Hash, Hasher};
 
@@ -8,13 +8,16 @@
 
 use chrono::Utc;
 use sqlx::SqlitePool;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
+use std::time::SystemTime;
 use uuid::Uuid;
 
 use crate::models::{SyncStatus, SyncStatusResponse};
-use super::session_parser::{extract_cwd, parse_session_full, ParsedSession};
+use super::session_parser::{extract_cwd, parse_sessions_parallel, ParsedSession};
+use super::sources::work_item::generate_session_hash;
 use super::worklog::calculate_session_hours;
 
 /// Sync Service for managing background synchronization
@@ -387,7 +390,7 @@ fn decode_dir_name_to_path(dir_name: &str) -> String {
 
 // ============ Claude Sync Logic ============
 
-// Shared functions from session_parser: parse_session_full, ParsedSession
+// Shared functions from session_parser: parse_sessions_parallel, ParsedSession
 // Shared from worklog: calculate_session_hours
 
 /// Sync result for Claude projects
@@ -463,19 +466,6 @@ fn generate_session_hash_legacy(user_id: &str, session_id: &str, project_path: &
     format!("sess_{:x}", hasher.finish())
 }
 
-/// Generate a unique hash for session-based deduplication (v2, uses only user_id + session_id).
-/// Since session_id is a UUID and already globally unique, including project_path
-/// is unnecessary and causes duplicate work items when the same session is seen
-/// from different sub-folder cwd values.
-fn generate_session_hash(user_id: &str, session_id: &str) -> String {
-    use std::collections::hash_map::DefaultHasher;
-    use std::hash::{Hash, Hasher};
-
-    let mut hasher = DefaultHasher::new();
-    format!("session:{}:{}", user_id, session_id).hash(&mut hasher);
-    format!("sess_{:x}", hasher.finish())
-}
-
 /// Find an existing work item by either the new hash or by session_id fallback.
 /// This handles the transition from old hashes (which included project_path)
 /// to new hashes (user_id + session_id only).
@@ -542,19 +532,31 @@ pub async fn sync_discovered_projects(
                 Err(_) => continue,
             };
 
-            for file_entry in files.flatten() {
-                let file_path = file_entry.path();
-                if !file_path
-                    .extension()
-                    .map(|e| e == "jsonl")
-                    .unwrap_or(false)
-                {
-                    continue;
-                }
+            let session_files: Vec<PathBuf> = files
+                .flatten()
+                .map(|entry| entry.path())
+                .filter(|path| path.extension().map(|e| e == "jsonl").unwrap_or(false))
+                .collect();
+
+            // Only re-parse sessions whose size or mtime changed since they were last
+            // synced. Unchanged ones still count as processed or skipped as before.
+            let SessionFilePartition {
+                changed,
+                fingerprints,
+                unchanged_with_items,
+                unchanged_empty,
+            } = changed_session_files(pool, user_id, project, session_files).await?;
+            sessions_processed += unchanged_with_items.len();
+            sessions_skipped += unchanged_empty;
+
+            // Decode the directory's sessions in parallel, then write them sequentially
+            for (file_path, parsed) in parse_sessions_parallel(changed) {
+                if let Some(session) = parsed {
+                    let fingerprint = fingerprints.get(&file_path).copied();
 
-                if let Some(session) = parse_session_full(&file_path) {
                     if session.message_count == 0 {
                         sessions_skipped += 1;
+                        mark_session_synced(user_id, project, &file_path, fingerprint, None);
                         continue;
                     }
 
@@ -700,6 +702,13 @@ pub async fn sync_discovered_projects(
                     }
 
                     sessions_processed += 1;
+                    mark_session_synced(
+                        user_id,
+                        project,
+                        &file_path,
+                        fingerprint,
+                        Some(&session_id),
+                    );
                 }
             }
         }
@@ -714,6 +723,158 @@ pub async fn sync_discovered_projects(
     })
 }
 
+/// Size and modification time of a session file
+type SessionFingerprint = (SystemTime, u64);
+
+/// Key of a synced session: user, canonical project path, project name (it
+/// goes into work item titles, so a rename must re-sync), session file
+type SyncedSessionKey = (String, String, String, PathBuf);
+
+fn synced_session_key(user_id: &str, project: &DiscoveredProject, path: &Path) -> SyncedSessionKey {
+    (
+        user_id.to_string(),
+        project.canonical_path.clone(),
+        project.name.clone(),
+        path.to_path_buf(),
+    )
+}
+
+/// A session file's fingerprint at its last sync, plus the session ID of the
+/// work item that sync wrote (`None` for sessions with no messages)
+type SyncedSession = (SessionFingerprint, Option<String>);
+
+/// Max session IDs bound into one `IN (...)` lookup, well under SQLite's limit
+const SESSION_LOOKUP_CHUNK: usize = 500;
+
+/// Session files as of their last successful sync.
+///
+/// Session files are append-only and most are long closed, so a periodic sync
+/// only needs to re-parse the few that grew. This lives in process memory: the
+/// first sync after startup still parses everything, and the CLI, which runs
+/// one sync per process, never benefits. An unchanged file is only skipped
+/// while its work item is still in the database, so deleting items (from the
+/// app, the CLI or a reset) gets them rebuilt on the next sync.
+static SYNCED_SESSIONS: OnceLock<Mutex<HashMap<SyncedSessionKey, SyncedSession>>> =
+    OnceLock::new();
+
+fn synced_sessions() -> &'static Mutex<HashMap<SyncedSessionKey, SyncedSession>> {
+    SYNCED_SESSIONS.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+fn session_fingerprint(path: &Path) -> Option<SessionFingerprint> {
+    let metadata = fs::metadata(path).ok()?;
+    Some((metadata.modified().ok()?, metadata.len()))
+}
+
+/// A directory's session files split by whether they need re-parsing
+struct SessionFilePartition {
+    /// Files whose size or mtime changed since their last sync, or that were
+    /// never synced
+    changed: Vec<PathBuf>,
+    fingerprints: HashMap<PathBuf, SessionFingerprint>,
+    /// Unchanged files whose sync produced a work item, with that session ID
+    unchanged_with_items: Vec<(PathBuf, SessionFingerprint, String)>,
+    /// Unchanged files with no messages
+    unchanged_empty: usize,
+}
+
+/// Split session files by whether their fingerprint matches the last sync
+fn partition_session_files(
+    user_id: &str,
+    project: &DiscoveredProject,
+    files: Vec<PathBuf>,
+) -> SessionFilePartition {
+    let mut partition = SessionFilePartition {
+        changed: Vec::with_capacity(files.len()),
+        fingerprints: HashMap::new(),
+        unchanged_with_items: Vec::new(),
+        unchanged_empty: 0,
+    };
+    let synced = match synced_sessions().lock() {
+        Ok(synced) => synced,
+        Err(_) => {
+            partition.changed = files;
+            return partition;
+        }
+    };
+
+    for path in files {
+        let fingerprint = session_fingerprint(&path);
+        if let Some(fingerprint) = fingerprint {
+            match synced.get(&synced_session_key(user_id, project, &path)) {
+                Some((synced_fp, None)) if *synced_fp == fingerprint => {
+                    partition.unchanged_empty += 1;
+                    continue;
+                }
+                Some((synced_fp, Some(session_id))) if *synced_fp == fingerprint => {
+                    partition
+                        .unchanged_with_items
+                        .push((path, fingerprint, session_id.clone()));
+                    continue;
+                }
+                _ => {}
+            }
+            partition.fingerprints.insert(path.clone(), fingerprint);
+        }
+        partition.changed.push(path);
+    }
+    partition
+}
+
+/// Partition session files, moving unchanged files whose work item no longer
+/// exists back to `changed` so they are rebuilt
+async fn changed_session_files(
+    pool: &SqlitePool,
+    user_id: &str,
+    project: &DiscoveredProject,
+    files: Vec<PathBuf>,
+) -> Result<SessionFilePartition, String> {
+    let mut partition = partition_session_files(user_id, project, files);
+
+    let mut existing: HashSet<String> = HashSet::new();
+    for chunk in partition.unchanged_with_items.chunks(SESSION_LOOKUP_CHUNK) {
+        let placeholders = vec!["?"; chunk.len()].join(", ");
+        let sql = format!(
+            "SELECT session_id FROM work_items WHERE user_id = ? AND source = 'claude_code' AND session_id IN ({})",
+            placeholders
+        );
+        let mut query = sqlx::query_as::<_, (String,)>(&sql).bind(user_id);
+        for (_, _, session_id) in chunk {
+            query = query.bind(session_id);
+        }
+        let rows = query.fetch_all(pool).await.map_err(|e| e.to_string())?;
+        existing.extend(rows.into_iter().map(|(session_id,)| session_id));
+    }
+
+    let (still_synced, deleted): (Vec<_>, Vec<_>) =
+        std::mem::take(&mut partition.unchanged_with_items)
+            .into_iter()
+            .partition(|(_, _, session_id)| existing.contains(session_id));
+    for (path, fingerprint, _) in deleted {
+        partition.fingerprints.insert(path.clone(), fingerprint);
+        partition.changed.push(path);
+    }
+    partition.unchanged_with_items = still_synced;
+    Ok(partition)
+}
+
+/// Remember that a session file was synced at the given fingerprint, and
+/// which session's work item it produced
+fn mark_session_synced(
+    user_id: &str,
+    project: &DiscoveredProject,
+    path: &Path,
+    fingerprint: Option<SessionFingerprint>,
+    session_id: Option<&str>,
+) {
+    if let (Some(fingerprint), Ok(mut synced)) = (fingerprint, synced_sessions().lock()) {
+        synced.insert(
+            synced_session_key(user_id, project, path),
+            (fingerprint, session_id.map(str::to_string)),
+        );
+    }
+}
+
 /// Sync Claude projects to work items (backward-compatible wrapper).
 /// Converts project_paths into `DiscoveredProject` structs with git root resolution
 /// and delegates to `sync_discovered_projects`.
@@ -873,33 +1034,6 @@ mod tests {
         assert_eq!(decode_dir_name_to_path("project"), "project");
     }
 
-    #[test]
-    fn test_generate_session_hash_consistent() {
-        let hash1 = generate_session_hash("user1", "session-abc");
-        let hash2 = generate_session_hash("user1", "session-abc");
-        assert_eq!(hash1, hash2, "Same inputs should produce same hash");
-    }
-
-    #[test]
-    fn test_generate_session_hash_different_sessions() {
-        let hash1 = generate_session_hash("user1", "session-abc");
-        let hash2 = generate_session_hash("user1", "session-def");
-        assert_ne!(hash1, hash2, "Different sessions should produce different hashes");
-    }
-
-    #[test]
-    fn test_generate_session_hash_different_users() {
-        let hash1 = generate_session_hash("user1", "session-abc");
-        let hash2 = generate_session_hash("user2", "session-abc");
-        assert_ne!(hash1, hash2, "Different users should produce different hashes");
-    }
-
-    #[test]
-    fn test_generate_session_hash_prefix() {
-        let hash = generate_session_hash("user1", "session-abc");
-        assert!(hash.starts_with("sess_"), "Hash should start with sess_ prefix");
-    }
-
     #[test]
     fn test_generate_session_hash_v2_differs_from_legacy() {
         let new_hash = generate_session_hash("user1", "session-abc");
@@ -919,4 +1053,58 @@ mod tests {
         };
         assert_eq!(project.name, "MyProject");
     }
+
+    #[test]
+    fn test_partition_session_files_skips_unchanged() {
+        let dir = tempfile::tempdir().unwrap();
+        let empty = dir.path().join("empty.jsonl");
+        let session = dir.path().join("session.jsonl");
+        fs::write(&empty, "{}\n").unwrap();
+        fs::write(&session, "{}\n").unwrap();
+        let project = DiscoveredProject {
+            canonical_path: dir.path().to_string_lossy().to_string(),
+            claude_dirs: vec![dir.path().to_path_buf()],
+            name: "skip".to_string(),
+        };
+        let files = vec![empty.clone(), session.clone()];
+
+        let first = partition_session_files("user-skip", &project, files.clone());
+        assert_eq!(first.changed, files);
+        mark_session_synced(
+            "user-skip",
+            &project,
+            &empty,
+            first.fingerprints.get(&empty).copied(),
+            None,
+        );
+        mark_session_synced(
+            "user-skip",
+            &project,
+            &session,
+            first.fingerprints.get(&session).copied(),
+            Some("session"),
+        );
+
+        // Unchanged: the empty session is counted and dropped outright, the
+        // other waits on the work item check
+        let second = partition_session_files("user-skip", &project, files.clone());
+        assert!(second.changed.is_empty());
+        assert_eq!(second.unchanged_empty, 1);
+        assert_eq!(second.unchanged_with_items.len(), 1);
+        assert_eq!(second.unchanged_with_items[0].2, "session");
+
+        // Renaming the project changes work item titles, so everything re-syncs
+        let renamed = DiscoveredProject {
+            name: "renamed".to_string(),
+            ..project.clone()
+        };
+        let after_rename = partition_session_files("user-skip", &renamed, files.clone());
+        assert_eq!(after_rename.changed, files);
+
+        // Appending changes the size, so the session is picked up again
+        fs::write(&session, "{}\n{}\n").unwrap();
+        let third = partition_session_files("user-skip", &project, files);
+        assert_eq!(third.changed, vec![session]);
+        assert!(third.unchanged_with_items.is_empty());
+    }
 }
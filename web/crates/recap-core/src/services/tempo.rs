@@ -5,12 +5,91 @@
 //! - Tempo Timesheets API (for worklog management)
 
 use anyhow::{anyhow, Result};
-use reqwest::{Client, header};
+use reqwest::{Client, RequestBuilder, Response, StatusCode, header};
+use std::collections::{HashMap, HashSet};
+use std::sync::{Mutex, OnceLock};
 use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
 use base64::{Engine as _, engine::general_purpose::STANDARD as BASE64};
 
 const DEFAULT_TIMEOUT_SECS: u64 = 30;
 
+/// Max worklog uploads in flight at once
+pub const UPLOAD_CONCURRENCY: usize = 8;
+
+/// Backoff before each retry of a transient GET failure
+const RETRY_BACKOFF_MS: [u64; 3] = [300, 600, 1200];
+
+/// Process-wide HTTP client shared by Jira and Tempo clients.
+///
+/// Commands construct a new `JiraClient`/`TempoClient` per call, so sharing
+/// one connection pool lets consecutive requests reuse keep-alive
+/// connections instead of paying a fresh TCP+TLS handshake each time.
+/// reqwest keeps idle connections without a per-host limit by default, so
+/// the pool is left unconfigured. Credentials stay per client and are sent
+/// as request headers.
+fn http_client() -> &'static Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT.get_or_init(|| {
+        Client::builder()
+            .timeout(std::time::Duration::from_secs(DEFAULT_TIMEOUT_SECS))
+            .build()
+            .unwrap_or_else(|_| Client::new())
+    })
+}
+
+/// Retry for idempotent Jira/Tempo reads.
+///
+/// Rate limiting (429), gateway errors and connection failures are retried
+/// with backoff. Timeouts are not: each attempt already waited the full
+/// request timeout, so retrying them could stall a command for minutes.
+/// Only GETs use this: retrying a worklog POST could log the same time twice.
+trait SendWithRetry {
+    async fn send_with_retry(self) -> reqwest::Result<Response>;
+}
+
+impl SendWithRetry for RequestBuilder {
+    async fn send_with_retry(self) -> reqwest::Result<Response> {
+        let mut request = self;
+        let mut attempt = 0;
+        while let (Some(delay), Some(next)) = (retry_delay(attempt), request.try_clone()) {
+            match request.send().await {
+                Ok(response) if !is_transient_status(response.status()) => return Ok(response),
+                Err(e) if !is_retryable_error(&e) => return Err(e),
+                _ => {}
+            }
+            tokio::time::sleep(delay).await;
+            request = next;
+            attempt += 1;
+        }
+        request.send().await
+    }
+}
+
+/// Backoff before retrying after the given failed attempt (0-based), or None
+/// once the retries are used up
+fn retry_delay(attempt: usize) -> Option<std::time::Duration> {
+    RETRY_BACKOFF_MS
+        .get(attempt)
+        .map(|&ms| std::time::Duration::from_millis(ms))
+}
+
+/// Connection failures are retried; timeouts already waited the full
+/// request timeout and everything else is not transient
+fn is_retryable_error(error: &reqwest::Error) -> bool {
+    error.is_connect() && !error.is_timeout()
+}
+
+fn is_transient_status(status: StatusCode) -> bool {
+    matches!(
+        status,
+        StatusCode::TOO_MANY_REQUESTS
+            | StatusCode::BAD_GATEWAY
+            | StatusCode::SERVICE_UNAVAILABLE
+            | StatusCode::GATEWAY_TIMEOUT
+    )
+}
+
 /// Worklog entry to upload
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct WorklogEntry {
@@ -95,7 +174,7 @@ impl From<&str> for JiraAuthType {
 /// Jira REST API client
 pub struct JiraClient {
     base_url: String,
-    client: Client,
+    headers: header::HeaderMap,
 }
 
 impl JiraClient {
@@ -135,18 +214,21 @@ impl JiraClient {
             header::HeaderValue::from_str(&auth_value)?,
         );
 
-        let client = Client::builder()
-            .default_headers(headers)
-            .timeout(std::time::Duration::from_secs(DEFAULT_TIMEOUT_SECS))
-            .build()?;
+        Ok(Self { base_url, headers })
+    }
 
-        Ok(Self { base_url, client })
+    fn get(&self, url: &str) -> RequestBuilder {
+        http_client().get(url).headers(self.headers.clone())
+    }
+
+    fn post(&self, url: &str) -> RequestBuilder {
+        http_client().post(url).headers(self.headers.clone())
     }
 
     /// Get current user information
     pub async fn get_myself(&self) -> Result<JiraUser> {
         let url = format!("{}/rest/api/2/myself", self.base_url);
-        let response = self.client.get(&url).send().await?;
+        let response = self.get(&url).send_with_retry().await?;
 
         if !response.status().is_success() {
             let status = response.status();
@@ -161,7 +243,7 @@ impl JiraClient {
     /// Get issue information
     pub async fn get_issue(&self, issue_key: &str) -> Result<Option<JiraIssue>> {
         let url = format!("{}/rest/api/2/issue/{}", self.base_url, issue_key);
-        let response = self.client.get(&url).send().await?;
+        let response = self.get(&url).send_with_retry().await?;
 
         if response.status() == reqwest::StatusCode::NOT_FOUND {
             return Ok(None);
@@ -178,7 +260,12 @@ impl JiraClient {
     }
 
     /// Validate an issue key exists and return full issue details
+    ///
+    /// Keys that can't be Jira keys at all are rejected without a request.
     pub async fn validate_issue_key(&self, issue_key: &str) -> Result<(bool, Option<JiraIssue>)> {
+        if !is_issue_key_format(issue_key) {
+            return Ok((false, None));
+        }
         match self.get_issue(issue_key).await? {
             Some(issue) => Ok((true, Some(issue))),
             None => Ok((false, None)),
@@ -197,7 +284,7 @@ impl JiraClient {
             "started": started
         });
 
-        let response = self.client.post(&url).json(&payload).send().await?;
+        let response = self.post(&url).json(&payload).send().await?;
 
         if !response.status().is_success() {
             let status = response.status();
@@ -220,14 +307,13 @@ impl JiraClient {
 
         loop {
             let url = format!("{}/rest/api/2/group/member", self.base_url);
-            let response = self.client
-                .get(&url)
+            let response = self.get(&url)
                 .query(&[
                     ("groupname", group_name),
                     ("startAt", &start_at.to_string()),
                     ("maxResults", &max_results.to_string()),
                 ])
-                .send()
+                .send_with_retry()
                 .await?;
 
             if !response.status().is_success() {
@@ -265,14 +351,13 @@ impl JiraClient {
         };
 
         let url = format!("{}/rest/api/2/search", self.base_url);
-        let response = self.client
-            .get(&url)
+        let response = self.get(&url)
             .query(&[
                 ("jql", jql.as_str()),
                 ("fields", "summary,issuetype,status"),
                 ("maxResults", &max_results.to_string()),
             ])
-            .send()
+            .send_with_retry()
             .await?;
 
         if !response.status().is_success() {
@@ -303,18 +388,18 @@ impl JiraClient {
         }
 
         let batch_size = 50;
-        for chunk in issue_keys.chunks(batch_size) {
+        for chunk in searchable_issue_keys(issue_keys).chunks(batch_size) {
             let jql = format!("key in ({})", chunk.join(","));
             let url = format!("{}/rest/api/2/search", self.base_url);
 
-            match self.client
-                .get(&url)
+            match self.get(&url)
                 .query(&[
                     ("jql", jql.as_str()),
                     ("fields", "issuetype"),
                     ("maxResults", &batch_size.to_string()),
+                    ("validateQuery", "false"),
                 ])
-                .send()
+                .send_with_retry()
                 .await
             {
                 Ok(response) if response.status().is_success() => {
@@ -335,23 +420,25 @@ impl JiraClient {
                         }
                     }
                 }
-                _ => {
-                    // Mark as Unknown if batch query fails
-                    for key in chunk {
-                        if !result.contains_key(key) {
-                            result.insert(key.clone(), "Unknown".to_string());
-                        }
-                    }
-                }
+                _ => {} // failed batches are marked Unknown below
             }
         }
 
+        // Mark as Unknown any key Jira didn't return: malformed, missing, or
+        // in a failed batch
+        for key in issue_keys {
+            result.entry(key.clone()).or_insert_with(|| "Unknown".to_string());
+        }
+
         Ok(result)
     }
 
     /// Batch get full issue details for multiple issue keys
+    ///
+    /// Keys that don't exist are simply missing from the result.
     pub async fn batch_get_issues(&self, issue_keys: &[String]) -> Result<Vec<JiraIssue>> {
         let mut all_issues = Vec::new();
+        let issue_keys = searchable_issue_keys(issue_keys);
         if issue_keys.is_empty() {
             return Ok(all_issues);
         }
@@ -361,14 +448,14 @@ impl JiraClient {
             let jql = format!("key in ({})", chunk.join(","));
             let url = format!("{}/rest/api/2/search", self.base_url);
 
-            match self.client
-                .get(&url)
+            match self.get(&url)
                 .query(&[
                     ("jql", jql.as_str()),
                     ("fields", "summary,description,assignee,issuetype"),
                     ("maxResults", &batch_size.to_string()),
+                    ("validateQuery", "false"),
                 ])
-                .send()
+                .send_with_retry()
                 .await
             {
                 Ok(response) if response.status().is_success() => {
@@ -393,7 +480,7 @@ impl JiraClient {
 /// Tempo Timesheets API client
 pub struct TempoClient {
     base_url: String,
-    client: Client,
+    headers: header::HeaderMap,
 }
 
 impl TempoClient {
@@ -415,21 +502,23 @@ impl TempoClient {
             header::HeaderValue::from_str(&format!("Bearer {}", api_token))?,
         );
 
-        let client = Client::builder()
-            .default_headers(headers)
-            .timeout(std::time::Duration::from_secs(DEFAULT_TIMEOUT_SECS))
-            .build()?;
+        Ok(Self { base_url, headers })
+    }
+
+    fn get(&self, url: &str) -> RequestBuilder {
+        http_client().get(url).headers(self.headers.clone())
+    }
 
-        Ok(Self { base_url, client })
+    fn post(&self, url: &str) -> RequestBuilder {
+        http_client().post(url).headers(self.headers.clone())
     }
 
     /// Get worklogs for a date range
     pub async fn get_worklogs(&self, date_from: &str, date_to: &str) -> Result<Vec<serde_json::Value>> {
         let url = format!("{}/rest/tempo-timesheets/4/worklogs", self.base_url);
-        let response = self.client
-            .get(&url)
+        let response = self.get(&url)
             .query(&[("dateFrom", date_from), ("dateTo", date_to)])
-            .send()
+            .send_with_retry()
             .await?;
 
         if !response.status().is_success() {
@@ -450,14 +539,13 @@ impl TempoClient {
         date_to: &str,
     ) -> Result<Vec<serde_json::Value>> {
         let url = format!("{}/rest/tempo-timesheets/4/worklogs", self.base_url);
-        let response = self.client
-            .get(&url)
+        let response = self.get(&url)
             .query(&[
                 ("worker", account_id),
                 ("dateFrom", date_from),
                 ("dateTo", date_to),
             ])
-            .send()
+            .send_with_retry()
             .await?;
 
         if !response.status().is_success() {
@@ -483,7 +571,7 @@ impl TempoClient {
             "authorAccountId": entry.account_id
         });
 
-        let response = self.client.post(&url).json(&payload).send().await?;
+        let response = self.post(&url).json(&payload).send().await?;
 
         if !response.status().is_success() {
             let status = response.status();
@@ -501,7 +589,7 @@ impl TempoClient {
     /// Get all Tempo teams
     pub async fn get_teams(&self) -> Result<Vec<serde_json::Value>> {
         let url = format!("{}/rest/tempo-teams/2/team", self.base_url);
-        let response = self.client.get(&url).send().await?;
+        let response = self.get(&url).send_with_retry().await?;
 
         if !response.status().is_success() {
             let status = response.status();
@@ -516,7 +604,7 @@ impl TempoClient {
     /// Get team members for a specific team
     pub async fn get_team_members(&self, team_id: i64) -> Result<Vec<serde_json::Value>> {
         let url = format!("{}/rest/tempo-teams/2/team/{}/member", self.base_url, team_id);
-        let response = self.client.get(&url).send().await?;
+        let response = self.get(&url).send_with_retry().await?;
 
         if !response.status().is_success() {
             let status = response.status();
@@ -529,11 +617,36 @@ impl TempoClient {
     }
 }
 
+/// (Jira URL, credential digest) identifying whose account ID is cached
+type AccountCacheKey = (String, String);
+
+/// Account IDs already resolved through `/myself`, shared across uploaders.
+///
+/// Every sync builds a fresh `WorklogUploader`, so without this each one
+/// would spend a round-trip asking Jira who the user is. Entries are keyed
+/// by a SHA-256 digest of the credentials; the token itself is not kept.
+fn account_ids() -> &'static Mutex<HashMap<AccountCacheKey, String>> {
+    static ACCOUNT_IDS: OnceLock<Mutex<HashMap<AccountCacheKey, String>>> = OnceLock::new();
+    ACCOUNT_IDS.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+fn account_cache_key(jira_url: &str, token: &str, email: Option<&str>) -> AccountCacheKey {
+    let mut hasher = Sha256::new();
+    hasher.update(email.unwrap_or_default().as_bytes());
+    hasher.update(b":");
+    hasher.update(token.as_bytes());
+    (
+        jira_url.trim_end_matches('/').to_string(),
+        format!("{:x}", hasher.finalize()),
+    )
+}
+
 /// Worklog uploader - unified interface for Jira and Tempo
 pub struct WorklogUploader {
     jira: JiraClient,
     tempo: Option<TempoClient>,
     account_id: Option<String>,
+    account_key: AccountCacheKey,
 }
 
 impl WorklogUploader {
@@ -549,15 +662,23 @@ impl WorklogUploader {
         let tempo = tempo_token
             .map(|t| TempoClient::new(jira_url, t))
             .transpose()?;
+        let account_key = account_cache_key(jira_url, token, email);
+        let account_id = account_ids()
+            .lock()
+            .ok()
+            .and_then(|ids| ids.get(&account_key).cloned());
 
         Ok(Self {
             jira,
             tempo,
-            account_id: None,
+            account_id,
+            account_key,
         })
     }
 
     /// Get current user's account ID
+    ///
+    /// Resolved IDs are shared with later uploaders for the same credentials.
     pub async fn get_account_id(&mut self) -> Result<String> {
         if let Some(ref id) = self.account_id {
             return Ok(id.clone());
@@ -566,6 +687,9 @@ impl WorklogUploader {
         let user = self.jira.get_myself().await?;
         let id = user.get_identifier()
             .ok_or_else(|| anyhow!("Could not determine user identifier"))?;
+        if let Ok(mut ids) = account_ids().lock() {
+            ids.insert(self.account_key.clone(), id.clone());
+        }
         self.account_id = Some(id.clone());
         Ok(id)
     }
@@ -582,13 +706,45 @@ impl WorklogUploader {
             entry.account_id = Some(self.get_account_id().await?);
         }
 
+        self.send_worklog(&entry, use_tempo).await
+    }
+
+    /// Upload several worklogs, up to `UPLOAD_CONCURRENCY` at a time.
+    ///
+    /// The account ID is resolved once up front, then each chunk of uploads
+    /// runs concurrently. Results are returned in the same order as `entries`.
+    pub async fn upload_worklogs(
+        &mut self,
+        mut entries: Vec<WorklogEntry>,
+        use_tempo: bool,
+    ) -> Vec<Result<WorklogResponse>> {
+        if entries.iter().any(|e| e.account_id.is_none()) {
+            match self.get_account_id().await {
+                Ok(id) => {
+                    for entry in entries.iter_mut().filter(|e| e.account_id.is_none()) {
+                        entry.account_id = Some(id.clone());
+                    }
+                }
+                Err(e) => return entries.iter().map(|_| Err(anyhow!("{}", e))).collect(),
+            }
+        }
+
+        let mut results = Vec::with_capacity(entries.len());
+        for chunk in entries.chunks(UPLOAD_CONCURRENCY) {
+            let futs: Vec<_> = chunk.iter().map(|entry| self.send_worklog(entry, use_tempo)).collect();
+            results.extend(futures::future::join_all(futs).await);
+        }
+        results
+    }
+
+    async fn send_worklog(&self, entry: &WorklogEntry, use_tempo: bool) -> Result<WorklogResponse> {
         if use_tempo {
             if let Some(ref tempo) = self.tempo {
-                return tempo.create_worklog(&entry).await;
+                return tempo.create_worklog(entry).await;
             }
         }
 
-        self.jira.add_worklog(&entry).await
+        self.jira.add_worklog(entry).await
     }
 
     /// Test connection
@@ -605,6 +761,35 @@ impl WorklogUploader {
     }
 }
 
+/// Whether a string has the shape of a Jira issue key: a project key that
+/// starts with a letter, a dash, then the issue number (e.g. `PROJ-123`).
+///
+/// Jira resolves keys case-insensitively, so lowercase input is accepted.
+pub fn is_issue_key_format(key: &str) -> bool {
+    let (project, number) = match key.split_once('-') {
+        Some(parts) => parts,
+        None => return false,
+    };
+    let mut project_chars = project.chars();
+    project_chars.next().is_some_and(|c| c.is_ascii_alphabetic())
+        && project_chars.all(|c| c.is_ascii_alphanumeric() || c == '_')
+        && !number.is_empty()
+        && number.chars().all(|c| c.is_ascii_digit())
+}
+
+/// Well-formed, de-duplicated keys for a JQL `key in (...)` search.
+///
+/// Jira rejects the whole query if any key fails to parse, which would cost
+/// every other key in the batch its result.
+fn searchable_issue_keys(issue_keys: &[String]) -> Vec<&str> {
+    let mut seen = HashSet::new();
+    issue_keys
+        .iter()
+        .map(String::as_str)
+        .filter(|key| is_issue_key_format(key) && seen.insert(*key))
+        .collect()
+}
+
 /// Build a JQL query string for issue search.
 ///
 /// Detects three patterns:
@@ -667,55 +852,244 @@ fn format_jira_datetime(date_str: &str) -> String {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+    use std::sync::Arc;
 
     #[test]
-    fn test_format_jira_datetime() {
-        let result = format_jira_datetime("2025-12-31");
-        assert_eq!(result, "2025-12-31T09:00:00.000+0800");
+    fn test_retry_delay_schedule() {
+        let delays: Vec<u64> = (0..)
+            .map_while(retry_delay)
+            .map(|d| d.as_millis() as u64)
+            .collect();
+        assert_eq!(delays, vec![300, 600, 1200]);
+        assert_eq!(retry_delay(RETRY_BACKOFF_MS.len()), None);
+    }
+
+    /// Local HTTP server answering every request with `status` (or never
+    /// answering when `hang` is set), counting the requests it received
+    fn serve_status(status: u16, hang: bool) -> (String, Arc<AtomicUsize>) {
+        use std::io::{Read, Write};
+
+        let listener = std::net::TcpListener::bind("127.0.0.1:0").unwrap();
+        let url = format!("http://{}/", listener.local_addr().unwrap());
+        let requests = Arc::new(AtomicUsize::new(0));
+        let counter = requests.clone();
+        std::thread::spawn(move || {
+            for mut stream in listener.incoming().flatten() {
+                let counter = counter.clone();
+                std::thread::spawn(move || {
+                    let mut buf = [0u8; 4096];
+                    let _ = stream.read(&mut buf);
+                    counter.fetch_add(1, Ordering::SeqCst);
+                    if hang {
+                        std::thread::sleep(std::time::Duration::from_secs(5));
+                        return;
+                    }
+                    let _ = write!(
+                        stream,
+                        "HTTP/1.1 {} X\r\nContent-Length: 0\r\nConnection: close\r\n\r\n",
+                        status
+                    );
+                });
+            }
+        });
+        (url, requests)
+    }
+
+    #[tokio::test]
+    async fn test_send_with_retry_returns_non_transient_status_immediately() {
+        for status in [200, 404, 500] {
+            let (url, requests) = serve_status(status, false);
+            let response = Client::new().get(&url).send_with_retry().await.unwrap();
+            assert_eq!(response.status().as_u16(), status);
+            assert_eq!(requests.load(Ordering::SeqCst), 1, "{}", status);
+        }
+    }
+
+    #[tokio::test]
+    async fn test_send_with_retry_caps_attempts() {
+        let (url, requests) = serve_status(503, false);
+        let response = Client::new().get(&url).send_with_retry().await.unwrap();
+        assert_eq!(response.status(), StatusCode::SERVICE_UNAVAILABLE);
+        assert_eq!(requests.load(Ordering::SeqCst), RETRY_BACKOFF_MS.len() + 1);
+    }
+
+    #[tokio::test]
+    async fn test_send_with_retry_does_not_retry_timeouts() {
+        let (url, requests) = serve_status(200, true);
+        let client = Client::builder()
+            .timeout(std::time::Duration::from_millis(200))
+            .build()
+            .unwrap();
+        let err = client.get(&url).send_with_retry().await.unwrap_err();
+        assert!(err.is_timeout());
+        assert!(!is_retryable_error(&err));
+        assert_eq!(requests.load(Ordering::SeqCst), 1);
+    }
+
+    #[tokio::test]
+    async fn test_connection_errors_are_retryable() {
+        // Bind then drop a listener to get a port nothing is listening on
+        let port = std::net::TcpListener::bind("127.0.0.1:0")
+            .unwrap()
+            .local_addr()
+            .unwrap()
+            .port();
+        let err = Client::new()
+            .get(format!("http://127.0.0.1:{}/", port))
+            .send()
+            .await
+            .unwrap_err();
+        assert!(is_retryable_error(&err));
     }
 
     #[test]
-    fn test_jira_auth_type_from_str() {
-        assert_eq!(JiraAuthType::from("pat"), JiraAuthType::Pat);
-        assert_eq!(JiraAuthType::from("PAT"), JiraAuthType::Pat);
-        assert_eq!(JiraAuthType::from("basic"), JiraAuthType::Basic);
-        assert_eq!(JiraAuthType::from("BASIC"), JiraAuthType::Basic);
-        assert_eq!(JiraAuthType::from("unknown"), JiraAuthType::Pat);
+    fn test_is_issue_key_format() {
+        assert!(is_issue_key_format("PROJ-123"));
+        assert!(is_issue_key_format("AB2_X-1"));
+        assert!(is_issue_key_format("proj-7"));
+        assert!(!is_issue_key_format("PROJ"));
+        assert!(!is_issue_key_format("PROJ-"));
+        assert!(!is_issue_key_format("PROJ-12a"));
+        assert!(!is_issue_key_format("1PROJ-1"));
+        assert!(!is_issue_key_format("PR OJ-1"));
+        assert!(!is_issue_key_format("../PROJ-1"));
+        assert!(!is_issue_key_format(""));
     }
 
     #[test]
-    fn test_build_search_jql_project_prefix() {
-        let jql = build_search_jql("PROJ");
-        assert_eq!(jql, r#"project = "PROJ" ORDER BY updated DESC"#);
+    fn test_jira_client_trims_trailing_slashes() {
+        for raw in [
+            "https://jira.example.com",
+            "https://jira.example.com/",
+            "https://jira.example.com//",
+        ] {
+            let client = JiraClient::new(raw, "token", None, JiraAuthType::Pat).unwrap();
+            assert_eq!(client.base_url, "https://jira.example.com", "{:?}", raw);
+        }
     }
 
     #[test]
-    fn test_build_search_jql_project_prefix_with_dash() {
-        let jql = build_search_jql("PROJ-");
-        assert_eq!(jql, r#"project = "PROJ" ORDER BY updated DESC"#);
+    fn test_jira_client_auth_header() {
+        let pat = JiraClient::new("https://jira.example.com", "test-pat", None, JiraAuthType::Pat).unwrap();
+        assert_eq!(pat.headers[header::AUTHORIZATION], "Bearer test-pat");
+
+        let basic = JiraClient::new(
+            "https://jira.example.com",
+            "api-token",
+            Some("user@example.com"),
+            JiraAuthType::Basic,
+        )
+        .unwrap();
+        let expected = format!("Basic {}", BASE64.encode("user@example.com:api-token"));
+        assert_eq!(basic.headers[header::AUTHORIZATION], expected.as_str());
+
+        assert!(JiraClient::new("https://jira.example.com", "api-token", None, JiraAuthType::Basic).is_err());
     }
 
     #[test]
-    fn test_build_search_jql_partial_key() {
-        let jql = build_search_jql("PROJ-12");
-        assert_eq!(jql, r#"key = "PROJ-12" OR project = "PROJ" ORDER BY updated DESC"#);
+    fn test_account_cache_key() {
+        let key = account_cache_key("https://jira.example.com/", "token", None);
+        assert_eq!(key.0, "https://jira.example.com");
+        assert!(!key.1.contains("token"));
+        assert_eq!(key, account_cache_key("https://jira.example.com", "token", None));
+        assert_ne!(key, account_cache_key("https://jira.example.com", "other", None));
+        assert_ne!(key, account_cache_key("https://jira.example.com", "token", Some("a@example.com")));
     }
 
     #[test]
-    fn test_build_search_jql_full_key() {
-        let jql = build_search_jql("PROJ-123");
-        assert_eq!(jql, r#"key = "PROJ-123" OR project = "PROJ" ORDER BY updated DESC"#);
+    fn test_uploader_reuses_cached_account_id() {
+        let url = "https://cached.jira.example.com";
+        let uncached = WorklogUploader::new(url, "fresh-token", None, "pat", None).unwrap();
+        assert_eq!(uncached.account_id, None);
+
+        account_ids()
+            .lock()
+            .unwrap()
+            .insert(account_cache_key(url, "primed-token", None), "acc-1".to_string());
+        let primed = WorklogUploader::new(url, "primed-token", None, "pat", None).unwrap();
+        assert_eq!(primed.account_id.as_deref(), Some("acc-1"));
     }
 
     #[test]
-    fn test_build_search_jql_free_text() {
-        let jql = build_search_jql("fix login bug");
-        assert_eq!(jql, r#"summary ~ "fix login bug" ORDER BY updated DESC"#);
+    fn test_is_transient_status() {
+        let cases = [
+            (429, true),
+            (502, true),
+            (503, true),
+            (504, true),
+            (400, false),
+            (401, false),
+            (404, false),
+            (500, false),
+            (501, false),
+            (200, false),
+        ];
+        for (code, transient) in cases {
+            let status = StatusCode::from_u16(code).unwrap();
+            assert_eq!(is_transient_status(status), transient, "{}", code);
+        }
     }
 
     #[test]
-    fn test_build_search_jql_lowercase_not_key() {
-        let jql = build_search_jql("proj-123");
-        assert_eq!(jql, r#"summary ~ "proj-123" ORDER BY updated DESC"#);
+    fn test_jira_user_get_identifier() {
+        let user = |account_id: Option<&str>, name: Option<&str>, key: Option<&str>| JiraUser {
+            account_id: account_id.map(String::from),
+            name: name.map(String::from),
+            key: key.map(String::from),
+            display_name: None,
+            email_address: None,
+        };
+        let cases = [
+            (user(Some("acc"), Some("name"), Some("key")), Some("acc")),
+            (user(None, Some("name"), Some("key")), Some("name")),
+            (user(None, None, Some("key")), Some("key")),
+            (user(None, None, None), None),
+        ];
+        for (user, expected) in cases {
+            assert_eq!(user.get_identifier().as_deref(), expected);
+        }
+    }
+
+    #[test]
+    fn test_searchable_issue_keys() {
+        let keys: Vec<String> = ["PROJ-1", "bad key", "PROJ-2", "PROJ-1", "", "OTHER-10"]
+            .iter()
+            .map(|k| k.to_string())
+            .collect();
+        assert_eq!(searchable_issue_keys(&keys), vec!["PROJ-1", "PROJ-2", "OTHER-10"]);
+    }
+
+    #[test]
+    fn test_format_jira_datetime() {
+        let result = format_jira_datetime("2025-12-31");
+        assert_eq!(result, "2025-12-31T09:00:00.000+0800");
+    }
+
+    #[test]
+    fn test_jira_auth_type_from_str() {
+        assert_eq!(JiraAuthType::from("pat"), JiraAuthType::Pat);
+        assert_eq!(JiraAuthType::from("PAT"), JiraAuthType::Pat);
+        assert_eq!(JiraAuthType::from("basic"), JiraAuthType::Basic);
+        assert_eq!(JiraAuthType::from("BASIC"), JiraAuthType::Basic);
+        assert_eq!(JiraAuthType::from("unknown"), JiraAuthType::Pat);
+    }
+
+    #[test]
+    fn test_build_search_jql() {
+        let cases = [
+            // Project prefix, with or without the dash
+            ("PROJ", r#"project = "PROJ" ORDER BY updated DESC"#),
+            ("PROJ-", r#"project = "PROJ" ORDER BY updated DESC"#),
+            // Partial or full key: exact match with project fallback
+            ("PROJ-12", r#"key = "PROJ-12" OR project = "PROJ" ORDER BY updated DESC"#),
+            ("PROJ-123", r#"key = "PROJ-123" OR project = "PROJ" ORDER BY updated DESC"#),
+            // Anything else searches the summary
+            ("fix login bug", r#"summary ~ "fix login bug" ORDER BY updated DESC"#),
+            ("proj-123", r#"summary ~ "proj-123" ORDER BY updated DESC"#),
+        ];
+        for (query, expected) in cases {
+            assert_eq!(build_search_jql(query), expected, "query {:?}", query);
+        }
     }
 }
@@ -0,0 +1,96 @@
+//! Integration test for Claude session sync against a real database
+
+use recap_core::db::Database;
+use recap_core::services::{sync_discovered_projects, DiscoveredProject};
+use std::fs;
+use tempfile::TempDir;
+
+/// Helper to create a test database
+async fn create_test_db() -> (Database, TempDir) {
+    let temp_dir = TempDir::new().expect("Failed to create temp dir");
+    let db_path = temp_dir.path().join("test.db");
+    let db = Database::open(db_path)
+        .await
+        .expect("Failed to create test database");
+    (db, temp_dir)
+}
+
+/// Insert the user that synced work items belong to
+async fn insert_test_user(pool: &sqlx::SqlitePool, user_id: &str) {
+    let now = chrono::Utc::now();
+    sqlx::query(
+        r#"
+        INSERT INTO users (id, email, password_hash, name, username, created_at, updated_at)
+        VALUES (?, 'sync@localhost', 'hash', 'Sync User', 'sync', ?, ?)
+        "#,
+    )
+    .bind(user_id)
+    .bind(now)
+    .bind(now)
+    .execute(pool)
+    .await
+    .expect("Failed to insert test user");
+}
+
+async fn count_work_items(pool: &sqlx::SqlitePool, user_id: &str) -> i64 {
+    let (count,): (i64,) = sqlx::query_as("SELECT COUNT(*) FROM work_items WHERE user_id = ?")
+        .bind(user_id)
+        .fetch_one(pool)
+        .await
+        .expect("Failed to count work items");
+    count
+}
+
+#[tokio::test]
+async fn test_resync_recreates_deleted_work_items() {
+    let (db, temp_dir) = create_test_db().await;
+    let pool = &db.pool;
+    let user_id = "test-user-resync";
+    insert_test_user(pool, user_id).await;
+
+    let claude_dir = temp_dir.path().join("claude-project");
+    fs::create_dir_all(&claude_dir).unwrap();
+    fs::write(
+        claude_dir.join("session-resync.jsonl"),
+        r#"{"type":"user","sessionId":"session-resync","cwd":"/test/resync","timestamp":"2026-01-05T10:00:00Z","message":{"role":"user","content":"Implement the login feature"}}
+{"type":"user","sessionId":"session-resync","cwd":"/test/resync","timestamp":"2026-01-05T11:00:00Z","message":{"role":"user","content":"Add tests for the login feature"}}
+"#,
+    )
+    .unwrap();
+    let projects = vec![DiscoveredProject {
+        canonical_path: "/test/resync".to_string(),
+        claude_dirs: vec![claude_dir],
+        name: "resync".to_string(),
+    }];
+
+    let first = sync_discovered_projects(pool, user_id, &projects)
+        .await
+        .unwrap();
+    assert_eq!(first.sessions_processed, 1);
+    assert_eq!(first.work_items_created, 1);
+
+    // Unchanged file with its work item in place: still counted as processed,
+    // but not re-parsed, so the work item is not rewritten
+    let second = sync_discovered_projects(pool, user_id, &projects)
+        .await
+        .unwrap();
+    assert_eq!(second.sessions_processed, 1);
+    assert_eq!(second.work_items_created, 0);
+    assert_eq!(second.work_items_updated, 0);
+    assert_eq!(count_work_items(pool, user_id).await, 1);
+
+    // Deleting the work items (as the danger zone and delete commands do)
+    // must not leave the unchanged session file skipped forever
+    sqlx::query("DELETE FROM work_items WHERE user_id = ?")
+        .bind(user_id)
+        .execute(pool)
+        .await
+        .unwrap();
+
+    let third = sync_discovered_projects(pool, user_id, &projects)
+        .await
+        .unwrap();
+    assert_eq!(third.sessions_processed, 1);
+    assert_eq!(third.work_items_created, 1);
+    assert_eq!(count_work_items(pool, user_id).await, 1);
+}
@@ -643,7 +643,7 @@ pub async fn sync_claude_projects(
 mod tests {
     use super::*;
     use std::io::Write;
-    use tempfile::NamedTempFile;
+    use tempfile::{tempdir, NamedTempFile};
 
     // ==================== get_claude_home Tests ====================
 
@@ -994,7 +994,7 @@ mod tests {
         // When agentId is not in the content, should extract from filename
         let content = r#"{"sessionId":"sess-123","timestamp":"2024-01-15T09:00:00+08:00","message":{"role":"user","content":"Test message here"}}"#;
 
-        let temp_dir = tempfile::tempdir().unwrap();
+        let temp_dir = tempdir().unwrap();
         let file_path = temp_dir.path().join("agent-abc123.jsonl");
         fs::write(&file_path, content).unwrap();
 
@@ -1008,8 +1008,6 @@ mod tests {
 
     #[test]
     fn test_discover_projects_from_directory_structure() {
-        use tempfile::tempdir;
-
         // Create mock Claude projects directory structure
         let temp_dir = tempdir().unwrap();
         let projects_dir = temp_dir.path().join("projects");
@@ -1074,19 +1072,16 @@ mod tests {
         // Verify discovery
         assert_eq!(projects.len(), 2, "Should discover 2 projects");
 
-        let project_a_found = projects.iter().find(|p| p.name == "project-a");
-        assert!(project_a_found.is_some(), "Should find project-a");
-        assert_eq!(project_a_found.unwrap().sessions.len(), 2, "project-a should have 2 sessions");
-
-        let project_b_found = projects.iter().find(|p| p.name == "project-b");
-        assert!(project_b_found.is_some(), "Should find project-b");
-        assert_eq!(project_b_found.unwrap().sessions.len(), 1, "project-b should have 1 session");
+        let sessions_by_name: HashMap<&str, usize> = projects
+            .iter()
+            .map(|p| (p.name.as_str(), p.sessions.len()))
+            .collect();
+        assert_eq!(sessions_by_name.get("project-a"), Some(&2), "project-a should have 2 sessions");
+        assert_eq!(sessions_by_name.get("project-b"), Some(&1), "project-b should have 1 session");
     }
 
     #[test]
     fn test_discover_projects_ignores_hidden_directories() {
-        use tempfile::tempdir;
-
         let temp_dir = tempdir().unwrap();
         let projects_dir = temp_dir.path().join("projects");
         fs::create_dir_all(&projects_dir).unwrap();
@@ -1124,8 +1119,6 @@ mod tests {
 
     #[test]
     fn test_discover_projects_handles_non_jsonl_files() {
-        use tempfile::tempdir;
-
         let temp_dir = tempdir().unwrap();
         let project_dir = temp_dir.path().join("projects").join("my-project");
         fs::create_dir_all(&project_dir).unwrap();
@@ -915,7 +915,6 @@ pub async fn complete_onboarding(
 #[cfg(test)]
 mod tests {
     use super::*;
-    use chrono::Utc;
     use recap_core::auth::create_token;
     use std::sync::Mutex;
 
@@ -1092,8 +1091,8 @@ mod tests {
             tempo_token: None,
             is_active: true,
             is_admin: false,
-            created_at: Utc::now(),
-            updated_at: Utc::now(),
+            created_at: chrono::DateTime::UNIX_EPOCH,
+            updated_at: chrono::DateTime::UNIX_EPOCH,
         }
     }
 
@@ -127,8 +127,8 @@ async fn fetch_work_items_for_project(
            ORDER BY date DESC, created_at DESC"#,
     )
     .bind(user_id)
-    .bind(start_date.format("%Y-%m-%d").to_string())
-    .bind(end_date.format("%Y-%m-%d").to_string())
+    .bind(start_date.to_string())
+    .bind(end_date.to_string())
     .fetch_all(pool)
     .await
     .map_err(|e| e.to_string())?;
@@ -637,8 +637,8 @@ pub async fn generate_completed_summaries(
            ORDER BY date DESC"#,
     )
     .bind(&user_id)
-    .bind(range_start.format("%Y-%m-%d").to_string())
-    .bind(today.format("%Y-%m-%d").to_string())
+    .bind(range_start.to_string())
+    .bind(today.to_string())
     .bind(format!("[{}]%", project_name))
     .bind(format!("%/{}", project_name))
     .fetch_all(&pool)
@@ -656,17 +656,17 @@ pub async fn generate_completed_summaries(
         if let Ok(date) = NaiveDate::parse_from_str(date_str, "%Y-%m-%d") {
             let (period_start, period_end, period_label) = match time_unit.as_str() {
                 "day" => (
-                    date.format("%Y-%m-%d").to_string(),
-                    date.format("%Y-%m-%d").to_string(),
-                    date.format("%Y-%m-%d").to_string(),
+                    date.to_string(),
+                    date.to_string(),
+                    date.to_string(),
                 ),
                 "week" => {
                     let week_start = date - chrono::Duration::days(date.weekday().num_days_from_monday() as i64);
                     let week_end = week_start + chrono::Duration::days(6);
                     let week_num = date.iso_week().week();
                     (
-                        week_start.format("%Y-%m-%d").to_string(),
-                        week_end.format("%Y-%m-%d").to_string(),
+                        week_start.to_string(),
+                        week_end.to_string(),
                         format!("{} W{:02}", date.year(), week_num),
                     )
                 },
@@ -679,8 +679,8 @@ pub async fn generate_completed_summaries(
                     };
                     let month_end = next_month - chrono::Duration::days(1);
                     (
-                        month_start.format("%Y-%m-%d").to_string(),
-                        month_end.format("%Y-%m-%d").to_string(),
+                        month_start.to_string(),
+                        month_end.to_string(),
                         date.format("%Y-%m").to_string(),
                     )
                 },
@@ -1324,8 +1324,8 @@ async fn find_missing_completed_periods(
            ORDER BY date"#,
     )
     .bind(user_id)
-    .bind(range_start.format("%Y-%m-%d").to_string())
-    .bind(today.format("%Y-%m-%d").to_string())
+    .bind(range_start.to_string())
+    .bind(today.to_string())
     .bind(format!("[{}]%", project_name))
     .bind(format!("%/{}", project_name))
     .fetch_all(pool)
@@ -1338,17 +1338,17 @@ async fn find_missing_completed_periods(
         if let Ok(date) = NaiveDate::parse_from_str(date_str, "%Y-%m-%d") {
             let (period_start, period_end, period_label) = match time_unit {
                 "day" => (
-                    date.format("%Y-%m-%d").to_string(),
-                    date.format("%Y-%m-%d").to_string(),
-                    date.format("%Y-%m-%d").to_string(),
+                    date.to_string(),
+                    date.to_string(),
+                    date.to_string(),
                 ),
                 "week" => {
                     let week_start = date - chrono::Duration::days(date.weekday().num_days_from_monday() as i64);
                     let week_end = week_start + chrono::Duration::days(6);
                     let week_num = date.iso_week().week();
                     (
-                        week_start.format("%Y-%m-%d").to_string(),
-                        week_end.format("%Y-%m-%d").to_string(),
+                        week_start.to_string(),
+                        week_end.to_string(),
                         format!("{} W{:02}", date.year(), week_num),
                     )
                 }
@@ -1361,8 +1361,8 @@ async fn find_missing_completed_periods(
                     };
                     let month_end = next_month - chrono::Duration::days(1);
                     (
-                        month_start.format("%Y-%m-%d").to_string(),
-                        month_end.format("%Y-%m-%d").to_string(),
+                        month_start.to_string(),
+                        month_end.to_string(),
                         date.format("%Y-%m").to_string(),
                     )
                 }
@@ -1377,8 +1377,8 @@ async fn find_missing_completed_periods(
                     };
                     let quarter_end = next_quarter - chrono::Duration::days(1);
                     (
-                        quarter_start.format("%Y-%m-%d").to_string(),
-                        quarter_end.format("%Y-%m-%d").to_string(),
+                        quarter_start.to_string(),
+                        quarter_end.to_string(),
                         format!("{} Q{}", date.year(), quarter + 1),
                     )
                 }
@@ -1386,8 +1386,8 @@ async fn find_missing_completed_periods(
                     let year_start = NaiveDate::from_ymd_opt(date.year(), 1, 1).unwrap();
                     let year_end = NaiveDate::from_ymd_opt(date.year(), 12, 31).unwrap();
                     (
-                        year_start.format("%Y-%m-%d").to_string(),
-                        year_end.format("%Y-%m-%d").to_string(),
+                        year_start.to_string(),
+                        year_end.to_string(),
                         format!("{}", date.year()),
                     )
                 }
@@ -1438,15 +1438,14 @@ async fn find_missing_completed_periods(
 mod tests {
     use super::*;
 
-    #[test]
-    fn test_derive_project_name_from_title() {
-        let item = WorkItem {
+    fn create_test_work_item(title: &str) -> WorkItem {
+        WorkItem {
             id: "1".to_string(),
             user_id: "user".to_string(),
             source: "claude_code".to_string(),
             source_id: None,
             source_url: None,
-            title: "[recap] Implement feature X".to_string(),
+            title: title.to_string(),
             description: None,
             hours: 1.0,
             date: NaiveDate::from_ymd_opt(2026, 1, 30).unwrap(),
@@ -1467,9 +1466,14 @@ mod tests {
             start_time: None,
             end_time: None,
             project_path: None,
-            created_at: chrono::Utc::now(),
-            updated_at: chrono::Utc::now(),
-        };
+            created_at: chrono::DateTime::UNIX_EPOCH,
+            updated_at: chrono::DateTime::UNIX_EPOCH,
+        }
+    }
+
+    #[test]
+    fn test_derive_project_name_from_title() {
+        let item = create_test_work_item("[recap] Implement feature X");
 
         assert_eq!(derive_project_name(&item), "recap");
     }
@@ -1477,34 +1481,8 @@ mod tests {
     #[test]
     fn test_derive_project_name_from_path() {
         let item = WorkItem {
-            id: "1".to_string(),
-            user_id: "user".to_string(),
-            source: "claude_code".to_string(),
-            source_id: None,
-            source_url: None,
-            title: "Working on something".to_string(),
-            description: None,
-            hours: 1.0,
-            date: NaiveDate::from_ymd_opt(2026, 1, 30).unwrap(),
-            jira_issue_key: None,
-            jira_issue_suggested: None,
-            jira_issue_title: None,
-            category: None,
-            tags: None,
-            yearly_goal_id: None,
-            synced_to_tempo: false,
-            tempo_worklog_id: None,
-            synced_at: None,
-            parent_id: None,
-            hours_source: None,
-            hours_estimated: None,
-            commit_hash: None,
-            session_id: None,
-            start_time: None,
-            end_time: None,
             project_path: Some("/home/user/projects/my-app".to_string()),
-            created_at: chrono::Utc::now(),
-            updated_at: chrono::Utc::now(),
+            ..create_test_work_item("Working on something")
         };
 
         assert_eq!(derive_project_name(&item), "my-app");
@@ -1513,34 +1491,10 @@ mod tests {
     #[test]
     fn test_calculate_data_hash() {
         let item1 = WorkItem {
-            id: "1".to_string(),
-            user_id: "user".to_string(),
             source: "manual".to_string(),
-            source_id: None,
-            source_url: None,
-            title: "Task 1".to_string(),
             description: Some("Description".to_string()),
             hours: 2.0,
-            date: NaiveDate::from_ymd_opt(2026, 1, 30).unwrap(),
-            jira_issue_key: None,
-            jira_issue_suggested: None,
-            jira_issue_title: None,
-            category: None,
-            tags: None,
-            yearly_goal_id: None,
-            synced_to_tempo: false,
-            tempo_worklog_id: None,
-            synced_at: None,
-            parent_id: None,
-            hours_source: None,
-            hours_estimated: None,
-            commit_hash: None,
-            session_id: None,
-            start_time: None,
-            end_time: None,
-            project_path: None,
-            created_at: chrono::Utc::now(),
-            updated_at: chrono::Utc::now(),
+            ..create_test_work_item("Task 1")
         };
 
         let hash1 = calculate_data_hash(&[item1.clone()]);
@@ -70,7 +70,7 @@ fn derive_project_name(item: &WorkItem) -> String {
 fn extract_local_date(ts: &str) -> String {
     if let Ok(dt) = DateTime::parse_from_rfc3339(ts) {
         let local = dt.with_timezone(&Local);
-        return local.format("%Y-%m-%d").to_string();
+        return local.date_naive().to_string();
     }
     ts.get(..10).unwrap_or(ts).to_string()
 }
@@ -78,7 +78,7 @@ fn extract_local_date(ts: &str) -> String {
 /// Get period label based on time unit
 fn get_period_label(date: &NaiveDate, time_unit: &str) -> String {
     match time_unit {
-        "day" => date.format("%Y-%m-%d").to_string(),
+        "day" => date.to_string(),
         "week" => {
             let iso_week = date.iso_week();
             format!("{} W{:02}", iso_week.year(), iso_week.week())
@@ -89,7 +89,7 @@ fn get_period_label(date: &NaiveDate, time_unit: &str) -> String {
             format!("{} Q{}", date.year(), quarter)
         }
         "year" => date.format("%Y").to_string(),
-        _ => date.format("%Y-%m-%d").to_string(),
+        _ => date.to_string(),
     }
 }
 
@@ -225,8 +225,8 @@ pub async fn get_project_timeline(
            ORDER BY date DESC, created_at DESC"#,
     )
     .bind(&claims.sub)
-    .bind(range_start.format("%Y-%m-%d").to_string())
-    .bind(effective_end.format("%Y-%m-%d").to_string())
+    .bind(range_start.to_string())
+    .bind(effective_end.to_string())
     .fetch_all(&db.pool)
     .await
     .map_err(|e| e.to_string())?;
@@ -246,8 +246,8 @@ pub async fn get_project_timeline(
         .collect();
 
     // Query snapshot_raw_data for commits
-    let snapshot_start = format!("{}T00:00:00", range_start.format("%Y-%m-%d"));
-    let snapshot_end = format!("{}T23:59:59", effective_end.format("%Y-%m-%d"));
+    let snapshot_start = format!("{}T00:00:00", range_start);
+    let snapshot_end = format!("{}T23:59:59", effective_end);
 
     // Get project paths from work items to query snapshots
     let project_paths: Vec<String> = project_items
@@ -355,7 +355,7 @@ pub async fn get_project_timeline(
     let next_cursor = if has_more && period_vec.len() > limit as usize {
         period_vec
             .get(limit as usize)
-            .map(|p| p.period_start.format("%Y-%m-%d").to_string())
+            .map(|p| p.period_start.to_string())
     } else {
         None
     };
@@ -366,8 +366,8 @@ pub async fn get_project_timeline(
         .take(limit as usize)
         .map(|p| TimelineGroup {
             period_label: p.period_label,
-            period_start: p.period_start.format("%Y-%m-%d").to_string(),
-            period_end: p.period_end.format("%Y-%m-%d").to_string(),
+            period_start: p.period_start.to_string(),
+            period_end: p.period_end.to_string(),
             total_hours: p.total_hours,
             summary: None, // Generated on-demand via generate_timeline_summary
             sessions: p.sessions,
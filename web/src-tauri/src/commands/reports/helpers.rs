@@ -220,8 +220,8 @@ mod tests {
             synced_to_tempo: false,
             tempo_worklog_id: None,
             synced_at: None,
-            created_at: chrono::Utc::now(),
-            updated_at: chrono::Utc::now(),
+            created_at: chrono::DateTime::UNIX_EPOCH,
+            updated_at: chrono::DateTime::UNIX_EPOCH,
             parent_id: None,
             hours_source: None,
             hours_estimated: None,
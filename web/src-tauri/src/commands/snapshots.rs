@@ -46,6 +46,15 @@ fn extract_local_date(ts: &str) -> String {
     ts.get(..10).unwrap_or(ts).to_string()
 }
 
+/// Snapshot activity accumulated for one (project, day) pair
+#[derive(Default)]
+struct DayStats {
+    commits: i32,
+    files: i32,
+    /// Distinct local HH:MM buckets seen that day
+    hours: std::collections::HashSet<String>,
+}
+
 /// Response type for work summaries
 #[derive(Debug, Serialize)]
 pub struct WorkSummaryResponse {
@@ -316,7 +325,7 @@ pub async fn get_worklog_overview(
     // hours = number of distinct hour buckets (each bucket ≈ 1 hour of activity)
     let mut snapshot_stats: Vec<(String, String, i32, i32, f64)> = Vec::new();
     {
-        let mut stats_map: std::collections::HashMap<(String, String), (i32, i32, std::collections::HashSet<String>)> = std::collections::HashMap::new();
+        let mut stats_map: std::collections::HashMap<(String, String), DayStats> = std::collections::HashMap::new();
         for snap in &raw_snapshots {
             let local_date = extract_local_date(&snap.hour_bucket);
             if local_date < start_date || local_date > end_date {
@@ -324,19 +333,19 @@ pub async fn get_worklog_overview(
             }
             let local_hour = extract_local_hour(&snap.hour_bucket);
             let key = (snap.project_path.clone(), local_date);
-            let entry = stats_map.entry(key).or_insert((0, 0, std::collections::HashSet::new()));
-            entry.0 += snap.git_commits.as_ref()
+            let stats = stats_map.entry(key).or_default();
+            stats.commits += snap.git_commits.as_ref()
                 .and_then(|g| serde_json::from_str::<Vec<serde_json::Value>>(g).ok())
                 .map(|v| v.len() as i32)
                 .unwrap_or(0);
-            entry.1 += snap.files_modified.as_ref()
+            stats.files += snap.files_modified.as_ref()
                 .and_then(|f| serde_json::from_str::<Vec<serde_json::Value>>(f).ok())
                 .map(|v| v.len() as i32)
                 .unwrap_or(0);
-            entry.2.insert(local_hour);
+            stats.hours.insert(local_hour);
         }
-        for ((project_path, day), (commits, files, hours_set)) in stats_map {
-            snapshot_stats.push((project_path, day, commits, files, hours_set.len() as f64));
+        for ((project_path, day), stats) in stats_map {
+            snapshot_stats.push((project_path, day, stats.commits, stats.files, stats.hours.len() as f64));
         }
         snapshot_stats.sort_by(|a, b| b.1.cmp(&a.1)); // newest first
     }
@@ -368,6 +377,17 @@ pub async fn get_worklog_overview(
     .await
     .map_err(|e| e.to_string())?;
 
+    // Index the (project, day) lookups the loops below make per row, instead
+    // of scanning both lists for every summary and snapshot
+    let hourly_keys: std::collections::HashSet<(&str, &str)> = hourly_exists
+        .iter()
+        .map(|(pp, d)| (pp.as_str(), d.as_str()))
+        .collect();
+    let snapshot_hours: std::collections::HashMap<(&str, &str), f64> = snapshot_stats
+        .iter()
+        .map(|(pp, d, _, _, h)| ((pp.as_str(), d.as_str()), *h))
+        .collect();
+
     // 5. Build the response: group by date
     let mut days_map: std::collections::BTreeMap<String, WorklogDay> = std::collections::BTreeMap::new();
 
@@ -416,12 +436,10 @@ pub async fn get_worklog_overview(
             .unwrap_or(0);
 
         // Get hours from snapshot stats for this project+date
-        let total_hours = snapshot_stats.iter()
-            .find(|(pp, d, _, _, _)| pp == &project_path && d == &date)
-            .map(|(_, _, _, _, h)| *h)
-            .unwrap_or(0.0);
+        let key = (project_path.as_str(), date.as_str());
+        let total_hours = snapshot_hours.get(&key).copied().unwrap_or(0.0);
 
-        let has_hourly = hourly_exists.iter().any(|(pp, d)| pp == &project_path && d == &date);
+        let has_hourly = hourly_keys.contains(&key);
 
         get_or_create_day(&mut days_map, &date);
         if let Some(day) = days_map.get_mut(&date) {
@@ -456,7 +474,7 @@ pub async fn get_worklog_overview(
                 continue;
             }
 
-            let has_hourly = hourly_exists.iter().any(|(pp, d)| pp == project_path && d == day);
+            let has_hourly = hourly_keys.contains(&(project_path.as_str(), day.as_str()));
 
             day_entry.projects.push(WorklogDayProject {
                 project_path: project_path.clone(),
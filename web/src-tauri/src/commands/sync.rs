@@ -673,8 +673,8 @@ mod tests {
             tempo_token: None,
             is_active: true,
             is_admin: false,
-            created_at: Utc::now(),
-            updated_at: Utc::now(),
+            created_at: chrono::DateTime::UNIX_EPOCH,
+            updated_at: chrono::DateTime::UNIX_EPOCH,
         }
     }
 
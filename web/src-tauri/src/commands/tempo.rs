@@ -2,13 +2,19 @@
 //!
 //! Tauri commands for Jira/Tempo integration operations.
 
+use std::collections::HashMap;
+
 use serde::{Deserialize, Serialize};
 use tauri::State;
 
 use recap_core::auth::verify_token;
-use recap_core::services::llm::{create_llm_service, parse_error_usage};
+use recap_core::services::llm::{
+    create_llm_service, parse_error_usage, parse_numbered_lines, LlmService, MAX_WORKLOG_BATCH,
+};
 use recap_core::services::llm_usage::save_usage_log;
-use recap_core::services::tempo::{JiraAuthType, JiraClient, TempoClient, WorklogEntry, WorklogUploader};
+use recap_core::services::tempo::{
+    is_issue_key_format, JiraAuthType, JiraClient, TempoClient, WorklogEntry, WorklogUploader,
+};
 
 use super::AppState;
 
@@ -38,6 +44,8 @@ pub struct WorklogEntryResponse {
     pub description: String,
     pub status: String,
     pub error_message: Option<String>,
+    /// Whether this entry shares one Tempo worklog with other entries
+    pub merged: bool,
 }
 
 #[derive(Debug, Deserialize)]
@@ -112,6 +120,11 @@ pub struct SummarizeDescriptionResponse {
     pub summary: String,
 }
 
+#[derive(Debug, Serialize)]
+pub struct SummarizeDescriptionsResponse {
+    pub summaries: Vec<String>,
+}
+
 /// Resolved Jira/Tempo config with auth type determined from stored credentials
 struct JiraConfig {
     jira_url: String,
@@ -157,36 +170,25 @@ async fn get_user_config(
 // Helpers
 
 /// Simple fallback: strip markdown, keep first line, truncate.
+///
+/// Stops at the first line with content and strips markdown in a single
+/// character pass, rather than cleaning every line of the input.
 fn sanitize_description_simple(raw: &str, max_len: usize) -> String {
-    let mut lines: Vec<String> = Vec::new();
-
     for line in raw.lines() {
-        let trimmed = line.trim();
-        if trimmed.is_empty() {
-            continue;
-        }
-
-        let stripped = trimmed
+        let stripped = line
+            .trim()
             .trim_start_matches("- ")
             .trim_start_matches("* ")
             .trim_start_matches("• ");
 
-        let cleaned: String = stripped
-            .replace("**", "")
-            .replace('*', "")
-            .replace('`', "");
-
-        let cleaned = cleaned.trim().to_string();
+        let cleaned: String = stripped.chars().filter(|&c| c != '*' && c != '`').collect();
+        let cleaned = cleaned.trim();
         if !cleaned.is_empty() {
-            lines.push(cleaned);
+            return truncate_str(cleaned, max_len);
         }
     }
 
-    if lines.is_empty() {
-        return String::new();
-    }
-
-    truncate_str(&lines[0], max_len)
+    String::new()
 }
 
 fn truncate_str(s: &str, max_len: usize) -> String {
@@ -200,6 +202,36 @@ fn truncate_str(s: &str, max_len: usize) -> String {
 /// Max description length for Tempo worklog
 const MAX_DESCRIPTION_LEN: usize = 50;
 
+/// Max concurrent per-entry LLM summary requests
+const SUMMARY_CONCURRENCY: usize = 4;
+
+/// Summarize one description with the LLM, falling back to simple sanitization.
+async fn summarize_description(
+    pool: &sqlx::SqlitePool,
+    user_id: &str,
+    llm: Option<&LlmService>,
+    desc: &str,
+) -> String {
+    if let Some(llm) = llm {
+        match llm.summarize_worklog(desc).await {
+            Ok((summary, usage)) => {
+                // Save usage log (best-effort)
+                let _ = save_usage_log(pool, user_id, &usage).await;
+                return truncate_str(summary.trim(), MAX_DESCRIPTION_LEN);
+            }
+            Err(err) => {
+                // Save error usage if available
+                if let Some(usage) = parse_error_usage(&err) {
+                    let _ = save_usage_log(pool, user_id, &usage).await;
+                }
+                log::warn!("LLM worklog summary failed, falling back: {}", err);
+            }
+        }
+    }
+
+    sanitize_description_simple(desc, MAX_DESCRIPTION_LEN)
+}
+
 /// Summarize descriptions using LLM, with fallback to simple sanitization.
 /// Returns a Vec of sanitized descriptions in the same order as inputs.
 async fn summarize_descriptions(
@@ -213,43 +245,68 @@ async fn summarize_descriptions(
         _ => None,
     };
 
-    let mut results = Vec::with_capacity(descriptions.len());
+    let mut results = vec![String::new(); descriptions.len()];
+    let mut pending: Vec<usize> = Vec::new();
 
-    for desc in descriptions {
+    for (i, desc) in descriptions.iter().enumerate() {
         if desc.trim().is_empty() {
-            results.push(String::new());
             continue;
         }
 
         // If already short enough (original fits within limit), skip LLM
         let stripped = desc.trim();
         if stripped.lines().count() <= 1 && stripped.chars().count() <= MAX_DESCRIPTION_LEN {
-            results.push(sanitize_description_simple(desc, MAX_DESCRIPTION_LEN));
+            results[i] = sanitize_description_simple(desc, MAX_DESCRIPTION_LEN);
             continue;
         }
 
-        // Try LLM
-        if let Some(ref llm) = llm {
-            match llm.summarize_worklog(desc).await {
-                Ok((summary, usage)) => {
-                    // Save usage log (best-effort)
-                    let _ = save_usage_log(pool, user_id, &usage).await;
-                    let trimmed = truncate_str(summary.trim(), MAX_DESCRIPTION_LEN);
-                    results.push(trimmed);
-                    continue;
-                }
-                Err(err) => {
-                    // Save error usage if available
-                    if let Some(usage) = parse_error_usage(&err) {
+        pending.push(i);
+    }
+
+    // Descriptions go out as numbered prompts of up to MAX_WORKLOG_BATCH each;
+    // anything a batch response doesn't cover falls through to the per-entry
+    // path below
+    if let Some(ref llm) = llm {
+        if pending.len() > 1 {
+            let mut unsummarized = Vec::new();
+            for batch_indices in pending.chunks(MAX_WORKLOG_BATCH) {
+                let batch: Vec<&str> = batch_indices.iter().map(|&i| descriptions[i].as_str()).collect();
+                match llm.summarize_worklogs(&batch).await {
+                    Ok((text, usage)) => {
                         let _ = save_usage_log(pool, user_id, &usage).await;
+                        match parse_numbered_lines(&text, batch.len()) {
+                            Some(lines) => {
+                                for (&i, line) in batch_indices.iter().zip(lines) {
+                                    results[i] = truncate_str(line.trim(), MAX_DESCRIPTION_LEN);
+                                }
+                                continue;
+                            }
+                            None => log::warn!("LLM batch worklog summary was incomplete, summarizing one by one"),
+                        }
+                    }
+                    Err(err) => {
+                        if let Some(usage) = parse_error_usage(&err) {
+                            let _ = save_usage_log(pool, user_id, &usage).await;
+                        }
+                        log::warn!("LLM batch worklog summary failed, summarizing one by one: {}", err);
                     }
-                    log::warn!("LLM worklog summary failed, falling back: {}", err);
                 }
+                unsummarized.extend_from_slice(batch_indices);
             }
+            pending = unsummarized;
         }
+    }
 
-        // Fallback
-        results.push(sanitize_description_simple(desc, MAX_DESCRIPTION_LEN));
+    // Per-entry summaries are independent LLM calls, so run them a chunk at a time
+    for chunk in pending.chunks(SUMMARY_CONCURRENCY) {
+        let futs: Vec<_> = chunk
+            .iter()
+            .map(|&i| summarize_description(pool, user_id, llm.as_ref(), &descriptions[i]))
+            .collect();
+        let chunk_results = futures::future::join_all(futs).await;
+        for (summary, &i) in chunk_results.into_iter().zip(chunk.iter()) {
+            results[i] = summary;
+        }
     }
 
     results
@@ -328,6 +385,11 @@ pub async fn validate_jira_issue(
                     message: format!("{}: {}", issue_key, summary),
                 })
             } else {
+                let message = if is_issue_key_format(&issue_key) {
+                    "Issue not found".to_string()
+                } else {
+                    "Invalid issue key format".to_string()
+                };
                 Ok(ValidateIssueResponse {
                     valid: false,
                     issue_key,
@@ -335,7 +397,7 @@ pub async fn validate_jira_issue(
                     description: None,
                     assignee: None,
                     issue_type: None,
-                    message: "Issue not found".to_string(),
+                    message,
                 })
             }
         }
@@ -343,6 +405,99 @@ pub async fn validate_jira_issue(
     }
 }
 
+/// Group worklog entries sharing (issue_key, date, description).
+///
+/// Returns each group's first entry index with its summed minutes (in
+/// first-seen order), plus the group index of every entry.
+fn coalesce_worklog_entries(entries: &[WorklogEntryRequest]) -> (Vec<(usize, i64)>, Vec<usize>) {
+    let mut index: HashMap<(&str, &str, &str), usize> = HashMap::new();
+    let mut groups: Vec<(usize, i64)> = Vec::new();
+    let mut group_of = Vec::with_capacity(entries.len());
+
+    for (i, entry) in entries.iter().enumerate() {
+        let key = (
+            entry.issue_key.as_str(),
+            entry.date.as_str(),
+            entry.description.as_str(),
+        );
+        let group = *index.entry(key).or_insert_with(|| {
+            groups.push((i, 0));
+            groups.len() - 1
+        });
+        groups[group].1 += entry.minutes;
+        group_of.push(group);
+    }
+
+    (groups, group_of)
+}
+
+/// The worklogs an upload actually posts for the requested entries, with the
+/// worklog index of every entry
+fn coalesced_worklogs(entries: &[WorklogEntryRequest]) -> (Vec<WorklogEntry>, Vec<usize>) {
+    let (groups, group_of) = coalesce_worklog_entries(entries);
+    let worklogs = groups
+        .iter()
+        .map(|&(first, minutes)| {
+            let entry_req = &entries[first];
+            WorklogEntry {
+                issue_key: entry_req.issue_key.clone(),
+                date: entry_req.date.clone(),
+                time_spent_seconds: minutes * 60,
+                description: entry_req.description.clone(),
+                account_id: None,
+            }
+        })
+        .collect();
+    (worklogs, group_of)
+}
+
+/// One result per requested entry, so results[i] matches entries[i] in both
+/// the dry-run preview (`outcomes` is None) and the upload. Entries sharing a
+/// worklog are marked `merged` and report that worklog's outcome.
+fn entry_results(
+    entries: &[WorklogEntryRequest],
+    group_of: &[usize],
+    outcomes: Option<&[Result<Option<String>, String>]>,
+) -> Vec<WorklogEntryResponse> {
+    let mut group_sizes: HashMap<usize, usize> = HashMap::new();
+    for &group in group_of {
+        *group_sizes.entry(group).or_insert(0) += 1;
+    }
+
+    entries
+        .iter()
+        .zip(group_of)
+        .map(|(entry_req, group)| {
+            let merged = group_sizes[group] > 1;
+            match outcomes.map(|outcomes| &outcomes[*group]) {
+                None => entry_response(entry_req, None, "pending", None, merged),
+                Some(Ok(id)) => entry_response(entry_req, id.clone(), "success", None, merged),
+                Some(Err(e)) => entry_response(entry_req, None, "error", Some(e.clone()), merged),
+            }
+        })
+        .collect()
+}
+
+fn entry_response(
+    entry_req: &WorklogEntryRequest,
+    id: Option<String>,
+    status: &str,
+    error_message: Option<String>,
+    merged: bool,
+) -> WorklogEntryResponse {
+    WorklogEntryResponse {
+        id,
+        issue_key: entry_req.issue_key.clone(),
+        date: entry_req.date.clone(),
+        minutes: entry_req.minutes,
+        hours: entry_req.minutes as f64 / 60.0,
+        description: entry_req.description.clone(),
+        status: status.to_string(),
+        error_message,
+        merged,
+    }
+}
+
 /// Sync multiple worklogs to Tempo/Jira
 #[tauri::command]
 pub async fn sync_worklogs_to_tempo(
@@ -370,65 +525,36 @@ pub async fn sync_worklogs_to_tempo(
     )
     .map_err(|e| e.to_string())?;
 
-    let mut results = Vec::new();
-    let mut successful = 0;
-    let mut failed = 0;
-
-    for entry_req in request.entries.iter() {
-        // Descriptions are already summarized by frontend (via summarize_tempo_description)
-        let desc = entry_req.description.clone();
-        let entry = WorklogEntry {
-            issue_key: entry_req.issue_key.clone(),
-            date: entry_req.date.clone(),
-            time_spent_seconds: entry_req.minutes * 60,
-            description: desc.clone(),
-            account_id: None,
-        };
-
-        if request.dry_run {
-            results.push(WorklogEntryResponse {
-                id: None,
-                issue_key: entry_req.issue_key.clone(),
-                date: entry_req.date.clone(),
-                minutes: entry_req.minutes,
-                hours: entry_req.minutes as f64 / 60.0,
-                description: desc,
-                status: "pending".to_string(),
-                error_message: None,
-            });
-            continue;
-        }
-
-        match uploader.upload_worklog(entry, use_tempo).await {
-            Ok(result) => {
-                results.push(WorklogEntryResponse {
-                    id: result.id.or(result.tempo_worklog_id.map(|id| id.to_string())),
-                    issue_key: entry_req.issue_key.clone(),
-                    date: entry_req.date.clone(),
-                    minutes: entry_req.minutes,
-                    hours: entry_req.minutes as f64 / 60.0,
-                    description: entry_req.description.clone(),
-                    status: "success".to_string(),
-                    error_message: None,
-                });
-                successful += 1;
-            }
-            Err(e) => {
-                results.push(WorklogEntryResponse {
-                    id: None,
-                    issue_key: entry_req.issue_key.clone(),
-                    date: entry_req.date.clone(),
-                    minutes: entry_req.minutes,
-                    hours: entry_req.minutes as f64 / 60.0,
-                    description: entry_req.description.clone(),
-                    status: "error".to_string(),
-                    error_message: Some(e.to_string()),
-                });
-                failed += 1;
-            }
-        }
+    // Entries sharing (issue, date, description) become one worklog, so
+    // duplicates only cost a single round-trip to Jira/Tempo. Descriptions are
+    // already summarized by frontend (via summarize_tempo_description)
+    let (worklogs, group_of) = coalesced_worklogs(&request.entries);
+    if worklogs.len() < request.entries.len() {
+        log::info!(
+            "Coalesced {} worklog entries into {} uploads",
+            request.entries.len(),
+            worklogs.len()
+        );
     }
 
+    let results = if request.dry_run {
+        entry_results(&request.entries, &group_of, None)
+    } else {
+        let outcomes: Vec<Result<Option<String>, String>> = uploader
+            .upload_worklogs(worklogs, use_tempo)
+            .await
+            .into_iter()
+            .map(|outcome| {
+                outcome
+                    .map(|result| result.id.or(result.tempo_worklog_id.map(|id| id.to_string())))
+                    .map_err(|e| e.to_string())
+            })
+            .collect();
+        entry_results(&request.entries, &group_of, Some(&outcomes))
+    };
+    let successful = results.iter().filter(|r| r.status == "success").count();
+    let failed = results.iter().filter(|r| r.status == "error").count();
+
     // Update synced_to_tempo status in database for successful uploads
     if !request.dry_run && successful > 0 {
         for result in &results {
@@ -582,9 +708,114 @@ pub async fn summarize_tempo_description(
 ) -> Result<SummarizeDescriptionResponse, String> {
     let claims = verify_token(&token).map_err(|e| e.to_string())?;
     let db = state.db.lock().await;
+    let pool = db.pool.clone();
+    drop(db); // Release lock before the LLM call
 
-    let descs = summarize_descriptions(&db.pool, &claims.sub, &[description]).await;
+    let descs = summarize_descriptions(&pool, &claims.sub, &[description]).await;
     let summary = descs.into_iter().next().unwrap_or_default();
 
     Ok(SummarizeDescriptionResponse { summary })
 }
+
+/// Summarize many worklog descriptions in one call, using a single batched
+/// LLM prompt where possible. Summaries are returned in input order.
+#[tauri::command]
+pub async fn summarize_tempo_descriptions(
+    state: State<'_, AppState>,
+    token: String,
+    descriptions: Vec<String>,
+) -> Result<SummarizeDescriptionsResponse, String> {
+    let claims = verify_token(&token).map_err(|e| e.to_string())?;
+    let db = state.db.lock().await;
+    let pool = db.pool.clone();
+    drop(db); // Release lock before the LLM calls
+
+    let summaries = summarize_descriptions(&pool, &claims.sub, &descriptions).await;
+
+    Ok(SummarizeDescriptionsResponse { summaries })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn entry(issue_key: &str, date: &str, minutes: i64, description: &str) -> WorklogEntryRequest {
+        WorklogEntryRequest {
+            issue_key: issue_key.to_string(),
+            date: date.to_string(),
+            minutes,
+            description: description.to_string(),
+        }
+    }
+
+    #[test]
+    fn test_coalesce_worklog_entries() {
+        let entries = vec![
+            entry("PROJ-1", "2025-01-13", 30, "Fix sync"),
+            entry("PROJ-2", "2025-01-13", 60, "Fix sync"),
+            entry("PROJ-1", "2025-01-13", 45, "Fix sync"),
+            entry("PROJ-1", "2025-01-14", 15, "Fix sync"),
+        ];
+
+        let (groups, group_of) = coalesce_worklog_entries(&entries);
+
+        assert_eq!(groups, vec![(0, 75), (1, 60), (3, 15)]);
+        assert_eq!(group_of, vec![0, 1, 0, 2]);
+    }
+
+    #[test]
+    fn test_dry_run_preview_matches_upload() {
+        let entries = vec![
+            entry("PROJ-1", "2025-01-13", 30, "Fix sync"),
+            entry("PROJ-2", "2025-01-13", 60, "Fix sync"),
+            entry("PROJ-1", "2025-01-13", 45, "Fix sync"),
+        ];
+
+        let (worklogs, group_of) = coalesced_worklogs(&entries);
+        assert_eq!(worklogs.len(), 2);
+        assert_eq!(worklogs[0].time_spent_seconds, 75 * 60);
+
+        let outcomes = vec![Ok(Some("10001".to_string())), Err("boom".to_string())];
+        let preview = entry_results(&entries, &group_of, None);
+        let uploaded = entry_results(&entries, &group_of, Some(&outcomes));
+
+        let rows = |results: &[WorklogEntryResponse]| -> Vec<(String, i64, bool)> {
+            results.iter().map(|r| (r.issue_key.clone(), r.minutes, r.merged)).collect()
+        };
+        assert_eq!(rows(&preview), rows(&uploaded));
+        assert_eq!(
+            rows(&preview),
+            vec![
+                ("PROJ-1".to_string(), 30, true),
+                ("PROJ-2".to_string(), 60, false),
+                ("PROJ-1".to_string(), 45, true),
+            ]
+        );
+        assert!(preview.iter().all(|r| r.status == "pending"));
+
+        let statuses: Vec<_> = uploaded.iter().map(|r| (r.status.as_str(), r.id.as_deref())).collect();
+        assert_eq!(
+            statuses,
+            vec![("success", Some("10001")), ("error", None), ("success", Some("10001"))]
+        );
+    }
+
+    #[test]
+    fn test_sanitize_description_simple() {
+        assert_eq!(sanitize_description_simple("\n  \n- **修正** `tempo.rs` 判斷\n第二行", 50), "修正 tempo.rs 判斷");
+        assert_eq!(sanitize_description_simple("* ``\n• 新增匯出", 50), "新增匯出");
+        assert_eq!(sanitize_description_simple("  \n ** \n", 50), "");
+        assert_eq!(sanitize_description_simple("abcdefghij", 8), "abcde...");
+    }
+
+    #[test]
+    fn test_entry_response() {
+        let req = entry("PROJ-1", "2025-01-13", 90, "Fix sync");
+        let resp = entry_response(&req, Some("10001".to_string()), "success", None, false);
+
+        assert_eq!(resp.id.as_deref(), Some("10001"));
+        assert_eq!(resp.minutes, 90);
+        assert!((resp.hours - 1.5).abs() < f64::EPSILON);
+        assert_eq!(resp.status, "success");
+    }
+}
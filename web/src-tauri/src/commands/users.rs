@@ -252,8 +252,8 @@ mod tests {
                 tempo_token: None,
                 is_active: true,
                 is_admin: false,
-                created_at: Utc::now(),
-                updated_at: Utc::now(),
+                created_at: chrono::DateTime::UNIX_EPOCH,
+                updated_at: chrono::DateTime::UNIX_EPOCH,
             }
         }
     }
@@ -294,15 +294,20 @@ mod tests {
         }
     }
 
+    /// Mock repository holding one user ("user-1"), plus a valid token for them
+    fn repo_with_user(name: &str) -> (MockProfileRepository, String) {
+        let user = MockProfileRepository::create_test_user("user-1", name);
+        let token = create_token(&user).unwrap();
+        (MockProfileRepository::new().with_user(user), token)
+    }
+
     // ========================================================================
     // get_profile Tests
     // ========================================================================
 
     #[tokio::test]
     async fn test_get_profile_success() {
-        let user = MockProfileRepository::create_test_user("user-1", "testuser");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("testuser");
 
         let result = get_profile_impl(&repo, &token).await.unwrap();
 
@@ -337,9 +342,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_update_profile_name() {
-        let user = MockProfileRepository::create_test_user("user-1", "oldname");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("oldname");
 
         let request = UpdateProfileRequest {
             name: Some("newname".to_string()),
@@ -353,9 +356,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_update_profile_email() {
-        let user = MockProfileRepository::create_test_user("user-1", "testuser");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("testuser");
 
         let request = UpdateProfileRequest {
             email: Some("newemail@example.com".to_string()),
@@ -369,9 +370,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_update_profile_title() {
-        let user = MockProfileRepository::create_test_user("user-1", "testuser");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("testuser");
 
         let request = UpdateProfileRequest {
             title: Some("Senior Developer".to_string()),
@@ -385,9 +384,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_update_profile_multiple_fields() {
-        let user = MockProfileRepository::create_test_user("user-1", "oldname");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("oldname");
 
         let request = UpdateProfileRequest {
             name: Some("newname".to_string()),
@@ -408,9 +405,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_update_profile_no_changes() {
-        let user = MockProfileRepository::create_test_user("user-1", "testuser");
-        let repo = MockProfileRepository::new().with_user(user.clone());
-        let token = create_token(&user).unwrap();
+        let (repo, token) = repo_with_user("testuser");
 
         let request = UpdateProfileRequest::default(); // No fields set
 
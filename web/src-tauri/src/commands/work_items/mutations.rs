@@ -221,18 +221,31 @@ fn read_items_jsonl(project_path: &str) -> Result<Vec<ManualItemEntry>, String>
 
 /// Write all items to the JSONL file
 fn write_items_jsonl(project_path: &str, items: &[ManualItemEntry]) -> Result<(), String> {
+    use std::io::Write;
+
     let file_path = get_items_jsonl_path(project_path);
 
-    let mut content = String::new();
+    // Serialize straight into one byte buffer rather than a String per line
+    let mut content: Vec<u8> = Vec::new();
     for item in items {
-        let line = serde_json::to_string(item)
+        serde_json::to_writer(&mut content, item)
             .map_err(|e| format!("Failed to serialize item: {}", e))?;
-        content.push_str(&line);
-        content.push('\n');
+        content.push(b'\n');
     }
 
-    std::fs::write(&file_path, content)
-        .map_err(|e| format!("Failed to write items.jsonl: {}", e))?;
+    // Write and fsync a sibling temp file, then rename it over items.jsonl,
+    // so a crash mid-write can't leave the manual items truncated
+    let tmp_path = file_path.with_extension("jsonl.tmp");
+    let result = (|| -> std::io::Result<()> {
+        let mut file = std::fs::File::create(&tmp_path)?;
+        file.write_all(&content)?;
+        file.sync_all()?;
+        std::fs::rename(&tmp_path, &file_path)
+    })();
+    if let Err(e) = result {
+        let _ = std::fs::remove_file(&tmp_path);
+        return Err(format!("Failed to write items.jsonl: {}", e));
+    }
 
     Ok(())
 }
@@ -259,8 +272,9 @@ fn append_manual_item_jsonl(
     };
 
     let file_path = get_items_jsonl_path(project_path);
-    let line = serde_json::to_string(&entry)
+    let mut line = serde_json::to_vec(&entry)
         .map_err(|e| format!("Failed to serialize item: {}", e))?;
+    line.push(b'\n');
 
     // Append to file
     use std::io::Write;
@@ -270,7 +284,8 @@ fn append_manual_item_jsonl(
         .open(&file_path)
         .map_err(|e| format!("Failed to open items.jsonl: {}", e))?;
 
-    writeln!(file, "{}", line)
+    // One write for the whole line, newline included
+    file.write_all(&line)
         .map_err(|e| format!("Failed to append to items.jsonl: {}", e))?;
 
     Ok(())
@@ -2,8 +2,8 @@
 //!
 //! Commands for batch sync and aggregation of work items.
 
-use std::collections::HashMap;
-use chrono::Utc;
+use std::collections::{HashMap, HashSet};
+use chrono::{NaiveDate, Utc};
 use tauri::State;
 use uuid::Uuid;
 
@@ -127,7 +127,7 @@ pub async fn aggregate_work_items(
     let original_count = work_items.len();
 
     // Group by project + date
-    let mut groups: HashMap<String, Vec<WorkItem>> = HashMap::new();
+    let mut groups: HashMap<(String, NaiveDate), Vec<WorkItem>> = HashMap::new();
 
     for item in work_items {
         let project = if let Some(start_idx) = item.title.find('[') {
@@ -146,26 +146,24 @@ pub async fn aggregate_work_items(
             "其他".to_string()
         };
 
-        let key = format!("{}|{}", project, item.date);
-        groups.entry(key).or_default().push(item);
+        groups.entry((project, item.date)).or_default().push(item);
     }
 
     let mut aggregated_count = 0;
     let mut child_ids: Vec<String> = Vec::new();
 
-    for (key, items) in groups {
+    for ((project_name, date), items) in groups {
         if items.len() <= 1 {
             continue;
         }
 
-        let parts: Vec<&str> = key.split('|').collect();
-        let project_name = parts[0];
-        let date = parts.get(1).unwrap_or(&"");
+        let date = date.to_string();
 
         let total_hours: f64 = items.iter().map(|i| i.hours).sum();
 
-        // Extract unique tasks
+        // Extract unique tasks (first occurrence order)
         let mut tasks: Vec<String> = Vec::new();
+        let mut seen: HashSet<String> = HashSet::new();
         for item in &items {
             let task = if let Some(idx) = item.title.find(']') {
                 item.title[idx + 1..].trim().to_string()
@@ -179,7 +177,7 @@ pub async fn aggregate_work_items(
                 task
             };
 
-            if !task.is_empty() && !tasks.contains(&task) {
+            if !task.is_empty() && seen.insert(task.clone()) {
                 tasks.push(task);
             }
         }
@@ -224,7 +222,7 @@ pub async fn aggregate_work_items(
         .bind(&title)
         .bind(&description)
         .bind(total_hours)
-        .bind(date)
+        .bind(&date)
         .bind(&jira_key)
         .bind(&jira_title)
         .bind(&category)
@@ -101,6 +101,7 @@ pub fn run() {
             commands::tempo::search_jira_issues,
             commands::tempo::batch_get_jira_issues,
             commands::tempo::summarize_tempo_description,
+            commands::tempo::summarize_tempo_descriptions,
             // Users
             commands::users::get_profile,
             commands::users::update_profile,
@@ -2,6 +2,7 @@ import { describe, it, expect, vi } from 'vitest'
 import { renderHook } from '@testing-library/react'
 import { IntegrationsProvider, useIntegrations } from './IntegrationsContext'
 import type { ReactNode } from 'react'
+import { mockConfigResponse } from '@/test/fixtures'
 
 // Mock the hooks
 vi.mock('../hooks/useJiraForm', () => ({
@@ -80,25 +81,7 @@ vi.mock('../hooks/useClaudeCodeForm', () => ({
 }))
 
 describe('IntegrationsContext', () => {
-  const mockConfig = {
-    daily_work_hours: 8,
-    normalize_hours: true,
-    timezone: null,
-    week_start_day: 1,
-    jira_url: null,
-    jira_configured: false,
-    tempo_configured: false,
-    gitlab_url: null,
-    gitlab_configured: false,
-    llm_provider: '',
-    llm_model: '',
-    llm_base_url: null,
-    llm_configured: false,
-    auth_type: '',
-    use_git_mode: false,
-    git_repos: [] as string[],
-    outlook_enabled: false,
-  }
+  const mockConfig = mockConfigResponse
 
   const mockSources = {
     mode: 'local',
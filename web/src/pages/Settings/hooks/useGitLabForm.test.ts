@@ -2,6 +2,7 @@ import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { renderHook, act } from '@testing-library/react'
 import { useGitLabForm } from './useGitLabForm'
 import { gitlab } from '@/services'
+import { mockConfigResponse } from '@/test/fixtures'
 
 vi.mock('@/services', () => ({
   gitlab: {
@@ -17,23 +18,10 @@ vi.mock('@/services', () => ({
 
 describe('useGitLabForm', () => {
   const mockConfig = {
-    daily_work_hours: 8,
-    normalize_hours: true,
-    timezone: null,
-    week_start_day: 1,
-    jira_url: null,
-    jira_configured: false,
-    tempo_configured: false,
+    ...mockConfigResponse,
     gitlab_url: 'https://gitlab.company.com',
     gitlab_configured: true,
-    llm_provider: '',
-    llm_model: '',
-    llm_base_url: null,
-    llm_configured: false,
     auth_type: 'pat',
-    use_git_mode: false,
-    git_repos: [] as string[],
-    outlook_enabled: false,
   }
 
   const mockProjects = [
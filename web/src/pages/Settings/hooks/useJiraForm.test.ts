@@ -2,6 +2,7 @@ import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { renderHook, act } from '@testing-library/react'
 import { useJiraForm } from './useJiraForm'
 import { config as configService, tempo } from '@/services'
+import { mockConfigResponse } from '@/test/fixtures'
 
 vi.mock('@/services', () => ({
   config: {
@@ -14,23 +15,10 @@ vi.mock('@/services', () => ({
 
 describe('useJiraForm', () => {
   const mockConfig = {
-    daily_work_hours: 8,
-    normalize_hours: true,
-    timezone: null,
-    week_start_day: 1,
+    ...mockConfigResponse,
     jira_url: 'https://company.atlassian.net',
     jira_configured: true,
-    tempo_configured: false,
-    gitlab_url: null,
-    gitlab_configured: false,
-    llm_provider: '',
-    llm_model: '',
-    llm_base_url: null,
-    llm_configured: false,
     auth_type: 'pat',
-    use_git_mode: false,
-    git_repos: [] as string[],
-    outlook_enabled: false,
   }
 
   beforeEach(() => {
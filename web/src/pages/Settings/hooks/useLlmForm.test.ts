@@ -2,6 +2,7 @@ import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { renderHook, act } from '@testing-library/react'
 import { useLlmForm } from './useLlmForm'
 import { config as configService } from '@/services'
+import { mockConfigResponse } from '@/test/fixtures'
 
 vi.mock('@/services', () => ({
   config: {
@@ -11,23 +12,11 @@ vi.mock('@/services', () => ({
 
 describe('useLlmForm', () => {
   const mockConfig = {
-    daily_work_hours: 8,
-    normalize_hours: true,
-    timezone: null,
-    week_start_day: 1,
-    jira_url: null,
-    jira_configured: false,
-    tempo_configured: false,
-    gitlab_url: null,
-    gitlab_configured: false,
+    ...mockConfigResponse,
     llm_provider: 'anthropic',
     llm_model: 'claude-3-5-sonnet-20241022',
     llm_base_url: '',
     llm_configured: true,
-    auth_type: '',
-    use_git_mode: false,
-    git_repos: [] as string[],
-    outlook_enabled: false,
   }
 
   beforeEach(() => {
@@ -2,6 +2,7 @@ import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { renderHook, act } from '@testing-library/react'
 import { usePreferencesForm } from './usePreferencesForm'
 import { config as configService } from '@/services'
+import { mockConfigResponse } from '@/test/fixtures'
 
 vi.mock('@/services', () => ({
   config: {
@@ -10,25 +11,7 @@ vi.mock('@/services', () => ({
 }))
 
 describe('usePreferencesForm', () => {
-  const mockConfig = {
-    daily_work_hours: 8,
-    normalize_hours: true,
-    timezone: null as string | null,
-    week_start_day: 1,
-    jira_url: null,
-    jira_configured: false,
-    tempo_configured: false,
-    gitlab_url: null,
-    gitlab_configured: false,
-    llm_provider: '',
-    llm_model: '',
-    llm_base_url: null,
-    llm_configured: false,
-    auth_type: '',
-    use_git_mode: false,
-    git_repos: [] as string[],
-    outlook_enabled: false,
-  }
+  const mockConfig = mockConfigResponse
 
   beforeEach(() => {
     vi.clearAllMocks()
@@ -10,7 +10,6 @@ import {
 } from '@/components/ui/dialog'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
-import { tempo } from '@/services'
 import * as jiraIssueCache from '@/services/jiraIssueCache'
 import { IssueKeyCombobox } from './IssueKeyCombobox'
 import { SummarizationProgress } from './SummarizationProgress'
@@ -78,7 +77,7 @@ export function TempoBatchSyncModal({
     }))
 
     try {
-      const result = await tempo.validateIssue(key)
+      const result = await jiraIssueCache.validate(key)
       setValidation((prev) => ({
         ...prev,
         [`${index}`]: {
@@ -217,7 +216,10 @@ export function TempoBatchSyncModal({
                                   <span className="ml-1 text-blue-600/70">{cached.summary}</span>
                                 )}
                               </td>
-                              <td className="px-2 py-1">{r.hours}h</td>
+                              <td className="px-2 py-1">
+                                {r.hours}h
+                                {r.merged && <span className="ml-1 text-blue-600/70">(merged)</span>}
+                              </td>
                               <td className="px-2 py-1 break-all">{r.description}</td>
                             </tr>
                           )
@@ -66,7 +66,7 @@ export function TempoSyncModal({
     }
     setValidating(true)
     try {
-      const result = await tempo.validateIssue(key)
+      const result = await jiraIssueCache.validate(key)
       setIssueValid(result.valid)
       setIssueSummary(result.valid ? (result.summary ?? '') : result.message)
     } catch (err) {
@@ -1,4 +1,4 @@
-import { Fragment, useState, useEffect, useCallback } from 'react'
+import { Fragment, useState, useEffect, useCallback, useMemo } from 'react'
 import { Check, AlertCircle, Loader2 } from 'lucide-react'
 import {
   Dialog,
@@ -10,7 +10,6 @@ import {
 } from '@/components/ui/dialog'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
-import { tempo } from '@/services'
 import * as jiraIssueCache from '@/services/jiraIssueCache'
 import { IssueKeyCombobox } from './IssueKeyCombobox'
 import { SummarizationProgress } from './SummarizationProgress'
@@ -86,7 +85,7 @@ export function TempoWeekSyncModal({
     }))
 
     try {
-      const result = await tempo.validateIssue(key)
+      const result = await jiraIssueCache.validate(key)
       setValidation((prev) => ({
         ...prev,
         [`${index}`]: {
@@ -104,17 +103,20 @@ export function TempoWeekSyncModal({
     }
   }, [rows])
 
-  // Group rows by date
-  const groupedByDate = rows.reduce<Record<string, { rows: BatchSyncRow[]; startIndex: number }[]>>((acc, row, i) => {
-    const date = row.date ?? 'unknown'
-    if (!acc[date]) acc[date] = []
-    acc[date].push({ rows: [row], startIndex: i })
-    return acc
-  }, {})
-
-  const sortedDates = Object.keys(groupedByDate).sort()
+  // Group rows by date, accumulating the total hours in the same pass. Memoized on
+  // rows so validation and summarize-log updates don't regroup the whole week.
+  const { groupedByDate, sortedDates, totalHours } = useMemo(() => {
+    const groupedByDate: Record<string, { rows: BatchSyncRow[]; startIndex: number }[]> = {}
+    let totalHours = 0
+    rows.forEach((row, i) => {
+      const date = row.date ?? 'unknown'
+      if (!groupedByDate[date]) groupedByDate[date] = []
+      groupedByDate[date].push({ rows: [row], startIndex: i })
+      totalHours += row.hours
+    })
+    return { groupedByDate, sortedDates: Object.keys(groupedByDate).sort(), totalHours }
+  }, [rows])
 
-  const totalHours = rows.reduce((sum, r) => sum + r.hours, 0)
   const filledRows = rows.filter((r) => r.issueKey.trim() !== '')
   const canSync = filledRows.length > 0 && !syncing && !summarizing
 
@@ -263,7 +265,10 @@ export function TempoWeekSyncModal({
                                 )}
                               </td>
                               <td className="px-2 py-1">{r.date}</td>
-                              <td className="px-2 py-1">{r.hours}h</td>
+                              <td className="px-2 py-1">
+                                {r.hours}h
+                                {r.merged && <span className="ml-1 text-blue-600/70">(merged)</span>}
+                              </td>
                               <td className="px-2 py-1 break-all">{r.description}</td>
                             </tr>
                           )
@@ -0,0 +1,96 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { renderHook, act } from '@testing-library/react'
+import { useSummarizeAction } from './useSummarizeAction'
+import { tempo } from '@/services'
+import type { BatchSyncRow } from '@/types'
+
+vi.mock('@/services', () => ({
+  tempo: {
+    summarizeDescriptions: vi.fn(),
+    summarizeDescription: vi.fn(),
+  },
+}))
+
+function row(projectName: string, description: string, issueKey = 'PROJ-1'): BatchSyncRow {
+  return {
+    projectPath: `/repo/${projectName}`,
+    projectName,
+    issueKey,
+    hours: 1,
+    description,
+    isManual: false,
+  }
+}
+
+describe('useSummarizeAction', () => {
+  const onSync = vi.fn()
+
+  beforeEach(() => {
+    vi.clearAllMocks()
+    onSync.mockResolvedValue(null)
+  })
+
+  async function run(rows: BatchSyncRow[]) {
+    const { result } = renderHook(() => useSummarizeAction({ rows, onSync }))
+    await act(async () => {
+      await result.current.handleAction(true)
+    })
+    const synced: BatchSyncRow[] = onSync.mock.calls[0][0]
+    return { result, synced }
+  }
+
+  it('should not call the LLM when no row has a description', async () => {
+    const { synced } = await run([row('a', '  ')])
+
+    expect(tempo.summarizeDescriptions).not.toHaveBeenCalled()
+    expect(tempo.summarizeDescription).not.toHaveBeenCalled()
+    expect(synced[0].description).toBe('  ')
+  })
+
+  it('should apply batch summaries and log each row', async () => {
+    vi.mocked(tempo.summarizeDescriptions).mockResolvedValue(['sum a', 'sum b'])
+
+    const { result, synced } = await run([row('a', 'log a'), row('b', 'log b')])
+
+    expect(tempo.summarizeDescriptions).toHaveBeenCalledWith(['log a', 'log b'])
+    expect(tempo.summarizeDescription).not.toHaveBeenCalled()
+    expect(synced.map((r) => r.description)).toEqual(['sum a', 'sum b'])
+    expect(result.current.summarizeLog).toContain('✓ a: "sum a"')
+    expect(result.current.summarizeLog).toContain('Done: 2 summarized, 0 fallback')
+  })
+
+  it('should send rows in batches and stream progress per batch', async () => {
+    const rows = Array.from({ length: 7 }, (_, i) => row(`p${i}`, `log ${i}`))
+    vi.mocked(tempo.summarizeDescriptions).mockImplementation(async (descs) => descs.map((d) => `sum ${d}`))
+
+    const { synced } = await run(rows)
+
+    expect(tempo.summarizeDescriptions).toHaveBeenCalledTimes(2)
+    expect(vi.mocked(tempo.summarizeDescriptions).mock.calls[1][0]).toEqual(['log 5', 'log 6'])
+    expect(synced[6].description).toBe('sum log 6')
+  })
+
+  it('should retry only the rows the batch missed', async () => {
+    vi.mocked(tempo.summarizeDescriptions).mockResolvedValue(['sum a', ''])
+    vi.mocked(tempo.summarizeDescription).mockResolvedValue('sum b')
+
+    const { synced } = await run([row('a', 'log a'), row('b', 'log b')])
+
+    expect(tempo.summarizeDescription).toHaveBeenCalledTimes(1)
+    expect(tempo.summarizeDescription).toHaveBeenCalledWith('log b')
+    expect(synced.map((r) => r.description)).toEqual(['sum a', 'sum b'])
+  })
+
+  it('should keep per-row summaries when the batch fails', async () => {
+    vi.mocked(tempo.summarizeDescriptions).mockRejectedValue(new Error('LLM down'))
+    vi.mocked(tempo.summarizeDescription)
+      .mockResolvedValueOnce('sum a')
+      .mockRejectedValueOnce(new Error('LLM down'))
+
+    const { result, synced } = await run([row('a', 'log a'), row('b', 'log b')])
+
+    expect(synced.map((r) => r.description)).toEqual(['sum a', 'log b'])
+    expect(result.current.summarizeLog).toContain('⚠ b: fallback')
+    expect(result.current.summarizeLog).toContain('Done: 1 summarized, 1 fallback')
+  })
+})
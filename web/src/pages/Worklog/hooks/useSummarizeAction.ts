@@ -2,6 +2,9 @@ import { useState, useCallback } from 'react'
 import { tempo } from '@/services'
 import type { BatchSyncRow, SyncWorklogsResponse } from '@/types'
 
+/** Rows summarized per LLM request */
+const SUMMARIZE_BATCH_SIZE = 5
+
 interface UseSummarizeActionOptions {
   rows: BatchSyncRow[]
   onSync: (rows: BatchSyncRow[], dryRun: boolean) => Promise<SyncWorklogsResponse | null>
@@ -24,17 +27,45 @@ export function useSummarizeAction({ rows, onSync }: UseSummarizeActionOptions)
     let successCount = 0
     let fallbackCount = 0
 
-    for (let i = 0; i < summarizedRows.length; i++) {
+    const indices = summarizedRows
+      .map((row, i) => (row.issueKey.trim() && row.description.trim() ? i : -1))
+      .filter((i) => i >= 0)
+
+    const applySummary = (i: number, summary: string) => {
       const row = summarizedRows[i]
-      if (!row.issueKey.trim() || !row.description.trim()) continue
+      summarizedRows[i] = { ...row, description: summary }
+      successCount++
+      return `✓ ${row.projectName}: "${summary}"`
+    }
+
+    // Small batches instead of a round-trip per row, so progress still streams
+    // in as each batch returns. Rows a batch didn't cover are retried one by
+    // one, keeping every summary that did come back.
+    const remaining: number[] = []
+    for (let start = 0; start < indices.length; start += SUMMARIZE_BATCH_SIZE) {
+      const batch = indices.slice(start, start + SUMMARIZE_BATCH_SIZE)
+      try {
+        const summaries = await tempo.summarizeDescriptions(batch.map((i) => summarizedRows[i].description))
+        const lines: string[] = []
+        batch.forEach((i, j) => {
+          if (summaries[j]) lines.push(applySummary(i, summaries[j]))
+          else remaining.push(i)
+        })
+        setSummarizeLog(prev => [...prev, ...lines])
+      } catch {
+        remaining.push(...batch)
+      }
+    }
+
+    for (const i of remaining) {
       try {
-        const summary = await tempo.summarizeDescription(row.description)
-        summarizedRows[i] = { ...row, description: summary }
-        successCount++
-        setSummarizeLog(prev => [...prev, `✓ ${row.projectName}: "${summary}"`])
+        const summary = await tempo.summarizeDescription(summarizedRows[i].description)
+        if (!summary) throw new Error('empty summary')
+        const line = applySummary(i, summary)
+        setSummarizeLog(prev => [...prev, line])
       } catch {
         fallbackCount++
-        setSummarizeLog(prev => [...prev, `⚠ ${row.projectName}: fallback`])
+        setSummarizeLog(prev => [...prev, `⚠ ${summarizedRows[i].projectName}: fallback`])
       }
     }
 
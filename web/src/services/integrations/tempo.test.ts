@@ -168,6 +168,20 @@ describe('tempo service', () => {
     })
   })
 
+  describe('summarizeDescriptions', () => {
+    it('should summarize descriptions in one call', async () => {
+      mockCommandValue('summarize_tempo_descriptions', { summaries: ['修正 auth', '新增匯出'] })
+
+      const result = await tempo.summarizeDescriptions(['long log 1', 'long log 2'])
+
+      expect(result).toEqual(['修正 auth', '新增匯出'])
+      expect(mockInvoke).toHaveBeenCalledWith('summarize_tempo_descriptions', {
+        token: 'test-token',
+        descriptions: ['long log 1', 'long log 2'],
+      })
+    })
+  })
+
   describe('getWorklogs', () => {
     it('should get worklogs from Tempo for a date range', async () => {
       mockCommandValue('get_tempo_worklogs', mockWorklogs)
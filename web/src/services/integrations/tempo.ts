@@ -63,3 +63,12 @@ export async function summarizeDescription(description: string): Promise<string>
   const res = await invokeAuth<{ summary: string }>('summarize_tempo_description', { description })
   return res.summary
 }
+
+/**
+ * Summarize many worklog descriptions in one batched LLM call (with fallback).
+ * Summaries are returned in input order.
+ */
+export async function summarizeDescriptions(descriptions: string[]): Promise<string[]> {
+  const res = await invokeAuth<{ summaries: string[] }>('summarize_tempo_descriptions', { descriptions })
+  return res.summaries
+}
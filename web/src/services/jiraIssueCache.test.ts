@@ -0,0 +1,58 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { tempo } from '@/services'
+import * as jiraIssueCache from './jiraIssueCache'
+
+vi.mock('@/services', () => ({
+  tempo: {
+    validateIssue: vi.fn(),
+    batchGetIssues: vi.fn(),
+  },
+}))
+
+// The cache is module-global, so each test uses its own issue keys
+describe('jiraIssueCache.validate', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+  })
+
+  it('should reject a malformed key without calling the backend', async () => {
+    for (const key of ['PROJ', 'PROJ-', '1PROJ-1', 'PR OJ-1', 'PROJ-12a']) {
+      const result = await jiraIssueCache.validate(key)
+      expect(result.valid).toBe(false)
+      expect(result.message).toBe('Invalid issue key format')
+    }
+    expect(tempo.validateIssue).not.toHaveBeenCalled()
+  })
+
+  it('should answer a valid key from the cache after the first lookup', async () => {
+    vi.mocked(tempo.validateIssue).mockResolvedValue({
+      valid: true,
+      issue_key: 'CACHE-1',
+      summary: 'Implement feature X',
+      issue_type: 'Task',
+      message: 'Issue found',
+    })
+
+    await jiraIssueCache.validate('CACHE-1')
+    const result = await jiraIssueCache.validate('CACHE-1')
+
+    expect(tempo.validateIssue).toHaveBeenCalledTimes(1)
+    expect(result.valid).toBe(true)
+    expect(result.summary).toBe('Implement feature X')
+    expect(result.issue_type).toBe('Task')
+  })
+
+  it('should not cache an invalid result', async () => {
+    vi.mocked(tempo.validateIssue)
+      .mockResolvedValueOnce({ valid: false, issue_key: 'LATER-1', message: 'Issue not found' })
+      .mockResolvedValueOnce({ valid: true, issue_key: 'LATER-1', summary: 'Created later', message: 'Issue found' })
+
+    const first = await jiraIssueCache.validate('LATER-1')
+    const second = await jiraIssueCache.validate('LATER-1')
+
+    expect(first.valid).toBe(false)
+    expect(second.valid).toBe(true)
+    expect(tempo.validateIssue).toHaveBeenCalledTimes(2)
+    expect(jiraIssueCache.get('LATER-1')?.summary).toBe('Created later')
+  })
+})
@@ -4,7 +4,8 @@
  * Stores issue details (summary, description, assignee, issue_type) keyed by
  * issue key. Populated by:
  *   - prefetch() — batch-loads details for multiple keys via one API call
- *   - set()     — called by JiraBadge / validation modals after individual fetch
+ *   - set()     — called by JiraBadge after individual fetch
+ *   - validate() — called by the Tempo sync modals when an issue key is entered
  *
  * Read by:
  *   - JiraBadge — reads on mount to show title inline without hover-fetch
@@ -12,6 +13,7 @@
  */
 
 import { tempo } from '@/services'
+import type { ValidateIssueResponse } from '@/types'
 
 const TTL_MS = 15 * 60 * 1000 // 15 minutes
 
@@ -60,6 +62,45 @@ export function has(key: string): boolean {
   return true
 }
 
+/** Jira issue key: a project key starting with a letter, a dash, digits (PROJ-123) */
+const ISSUE_KEY_PATTERN = /^[A-Za-z][A-Za-z0-9_]*-\d+$/
+
+/**
+ * Validate an issue key, answering from the cache when the issue is already known.
+ * Malformed keys are rejected without a backend call. Valid results are cached,
+ * so re-validating the same key across rows or modals skips the Jira round-trip;
+ * invalid results are not, so an issue created later validates on the next try.
+ */
+export async function validate(key: string): Promise<ValidateIssueResponse> {
+  if (!ISSUE_KEY_PATTERN.test(key)) {
+    return { valid: false, issue_key: key, message: 'Invalid issue key format' }
+  }
+
+  const cached = get(key)
+  if (cached?.summary) {
+    return {
+      valid: true,
+      issue_key: key,
+      summary: cached.summary,
+      description: cached.description,
+      assignee: cached.assignee,
+      issue_type: cached.issueType,
+      message: `${key}: ${cached.summary}`,
+    }
+  }
+
+  const result = await tempo.validateIssue(key)
+  if (result.valid) {
+    set(key, {
+      summary: result.summary ?? '',
+      description: result.description,
+      assignee: result.assignee,
+      issueType: result.issue_type,
+    })
+  }
+  return result
+}
+
 /**
  * Batch-prefetch issue details for the given keys.
  * Skips keys already cached (and not expired) or currently in-flight.
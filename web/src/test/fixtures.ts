@@ -13,8 +13,31 @@ import type {
   PersonalReport,
   TempoReport,
   AnalyzeResponse,
+  ConfigResponse,
 } from '@/types'
 
+// Config fixtures: nothing configured; tests spread and override the
+// integration they exercise
+export const mockConfigResponse: ConfigResponse = {
+  daily_work_hours: 8,
+  normalize_hours: true,
+  timezone: null,
+  week_start_day: 1,
+  jira_url: null,
+  jira_configured: false,
+  tempo_configured: false,
+  gitlab_url: null,
+  gitlab_configured: false,
+  llm_provider: '',
+  llm_model: '',
+  llm_base_url: null,
+  llm_configured: false,
+  auth_type: '',
+  use_git_mode: false,
+  git_repos: [],
+  outlook_enabled: false,
+}
+
 // Auth fixtures
 export const mockUser: UserResponse = {
   id: 'user-123',
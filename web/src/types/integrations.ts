@@ -111,6 +111,8 @@ export interface WorklogEntryResponse {
   description: string
   status: string
   error_message?: string
+  /** Shares one Tempo worklog with other entries (same issue, date, description) */
+  merged?: boolean
 }
 
 export interface SyncWorklogsRequest {